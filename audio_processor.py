@@ -3,11 +3,13 @@ Audio processing utilities for handling large audio files.
 Includes file size checking and smart audio splitting with silence detection.
 """
 import os
+import shutil
+import threading
 import wave
 import numpy as np
 import tempfile
 import logging
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Dict, Iterable
 from pathlib import Path
 from config import config
 
@@ -15,24 +17,44 @@ from config import config
 class AudioProcessor:
     """Handles audio file processing including size checking and smart splitting."""
     
+    # Maximum number of cached check_file_size results
+    _SIZE_CHECK_CACHE_SIZE = 64
+    
     def __init__(self):
         """Initialize the audio processor."""
         self.temp_files: List[str] = []  # Track temporary files for cleanup
+        # Chunk files are removed from pool threads while the splitter adds more
+        self._temp_files_lock = threading.Lock()
+        # check_file_size results keyed on (path, mtime_ns, size)
+        self._size_checks: Dict[Tuple[str, int, int], Tuple[bool, float]] = {}
     
-    def check_file_size(self, file_path: str) -> Tuple[bool, float]:
+    def check_file_size(self, file_path: str,
+                        stat_result: Optional[os.stat_result] = None) -> Tuple[bool, float]:
         """Check if audio file exceeds size limit.
         
+        Results are cached on the file's path, modification time and size,
+        so repeat checks of an unchanged file only cost the stat call.
+        
         Args:
             file_path: Path to the audio file to check.
+            stat_result: Result of os.stat() for the file if the caller already
+                has one, to skip another stat call.
             
         Returns:
             Tuple of (needs_splitting, file_size_mb)
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Audio file not found: {file_path}")
+        if stat_result is None:
+            try:
+                stat_result = os.stat(file_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Audio file not found: {file_path}")
+        
+        key = (file_path, stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._size_checks.get(key)
+        if cached is not None:
+            return cached
         
-        file_size_bytes = os.path.getsize(file_path)
-        file_size_mb = file_size_bytes / (1024 * 1024)  # Convert to MB
+        file_size_mb = stat_result.st_size / (1024 * 1024)  # Convert to MB
         
         needs_splitting = file_size_mb > config.MAX_FILE_SIZE_MB
         
@@ -40,14 +62,23 @@ class AudioProcessor:
         if needs_splitting:
             logging.info("File exceeds size limit, splitting will be required")
         
+        if len(self._size_checks) >= self._SIZE_CHECK_CACHE_SIZE:
+            self._size_checks.clear()
+        self._size_checks[key] = (needs_splitting, file_size_mb)
         return needs_splitting, file_size_mb
     
-    def split_audio_file(self, input_file: str, progress_callback: Optional[callable] = None) -> List[str]:
+    def split_audio_file(self, input_file: str, progress_callback: Optional[callable] = None,
+                         on_chunk_ready: Optional[callable] = None) -> List[str]:
         """Split audio file into smaller chunks using silence detection.
         
         Args:
             input_file: Path to the input audio file.
             progress_callback: Optional callback function for progress updates.
+            on_chunk_ready: Optional callback taking (chunk_path, index), called
+                as soon as each chunk file is written so it can be processed
+                while later chunks are still being created. Chunks handed out
+                may still be in use if splitting fails, so the caller must
+                call cleanup_temp_files() once they are done.
             
         Returns:
             List of paths to the split audio files.
@@ -79,19 +110,24 @@ class AudioProcessor:
                 progress_callback(f"Creating {len(split_points)} audio chunks...")
             
             # Create chunks
-            chunk_files = self._create_chunks(audio_data, sample_rate, split_points, input_file)
+            chunk_files = self._create_chunks(audio_data, sample_rate, split_points, input_file,
+                                              on_chunk_ready)
             
             logging.info(f"Successfully split audio into {len(chunk_files)} chunks")
             return chunk_files
             
         except Exception as e:
             logging.error(f"Failed to split audio file: {e}")
-            self.cleanup_temp_files()
+            if on_chunk_ready is None:
+                self.cleanup_temp_files()
             raise
     
     def _load_audio_data(self, file_path: str) -> Tuple[np.ndarray, int]:
         """Load audio data from WAV file.
         
+        16-bit mono files (what the recorder writes) are memory-mapped rather
+        than read, so large files are paged in on demand instead of copied.
+        
         Args:
             file_path: Path to the WAV file.
             
@@ -105,6 +141,18 @@ class AudioProcessor:
             channels = wav_file.getnchannels()
             sample_width = wav_file.getsampwidth()
             
+            # Already in the target format: map the samples in place
+            if sample_width == 2 and channels == 1 and frames > 0:
+                data_offset = self._find_wav_data_offset(file_path)
+                if data_offset is not None:
+                    # A truncated file may hold fewer samples than its header claims
+                    available = (os.path.getsize(file_path) - data_offset) // 2
+                    frames = min(frames, available)
+                    if frames > 0:
+                        audio_data = np.memmap(file_path, dtype='<i2', mode='r',
+                                               offset=data_offset, shape=(frames,))
+                        return audio_data, sample_rate
+            
             # Read raw audio data
             raw_data = wav_file.readframes(frames)
             
@@ -129,6 +177,32 @@ class AudioProcessor:
             
             return audio_data, sample_rate
     
+    @staticmethod
+    def _find_wav_data_offset(file_path: str) -> Optional[int]:
+        """Find where the sample data starts in a WAV file.
+        
+        Args:
+            file_path: Path to the WAV file.
+            
+        Returns:
+            Byte offset of the data chunk's payload, or None if it can't be found.
+        """
+        with open(file_path, 'rb') as f:
+            header = f.read(12)
+            if header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+                return None
+            
+            while True:
+                chunk_header = f.read(8)
+                if len(chunk_header) < 8:
+                    return None
+                chunk_id = chunk_header[:4]
+                chunk_size = int.from_bytes(chunk_header[4:], 'little')
+                if chunk_id == b'data':
+                    return f.tell()
+                # Chunks are padded to an even size
+                f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    
     def _find_split_points(self, audio_data: np.ndarray, sample_rate: int) -> List[int]:
         """Find optimal split points in audio using silence detection.
         
@@ -243,7 +317,8 @@ class AudioProcessor:
         return split_points
     
     def _create_chunks(self, audio_data: np.ndarray, sample_rate: int, 
-                      split_points: List[int], original_file: str) -> List[str]:
+                      split_points: List[int], original_file: str,
+                      on_chunk_ready: Optional[callable] = None) -> List[str]:
         """Create individual audio chunk files.
         
         Args:
@@ -251,6 +326,7 @@ class AudioProcessor:
             sample_rate: Sample rate.
             split_points: List of split point indices.
             original_file: Path to original file for metadata.
+            on_chunk_ready: Optional callback taking (chunk_path, index) for each written chunk.
             
         Returns:
             List of paths to created chunk files.
@@ -260,6 +336,8 @@ class AudioProcessor:
         
         # Create temporary directory for chunks
         temp_dir = tempfile.mkdtemp(prefix="audio_chunks_")
+        with self._temp_files_lock:
+            self.temp_files.append(temp_dir)  # Add directory for cleanup
         
         # Create chunks
         start_idx = 0
@@ -277,15 +355,18 @@ class AudioProcessor:
             self._save_audio_chunk(chunk_data, sample_rate, chunk_filename)
             
             chunk_files.append(chunk_filename)
-            self.temp_files.append(chunk_filename)
+            with self._temp_files_lock:
+                self.temp_files.append(chunk_filename)
             
             start_idx = end_idx
             
             logging.info(f"Created chunk {i+1}: {chunk_filename} "
                         f"({len(chunk_data)/sample_rate:.1f}s, "
                         f"{os.path.getsize(chunk_filename)/(1024*1024):.1f}MB)")
+            
+            if on_chunk_ready:
+                on_chunk_ready(chunk_filename, i)
         
-        self.temp_files.append(temp_dir)  # Add directory for cleanup
         return chunk_files
     
     def _save_audio_chunk(self, audio_data: np.ndarray, sample_rate: int, filename: str):
@@ -300,56 +381,71 @@ class AudioProcessor:
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+            # Write straight from the (possibly memory-mapped) slice, without a bytes copy
+            wav_file.writeframes(np.ascontiguousarray(audio_data, dtype='<i2').data)
+    
+    def remove_temp_file(self, file_path: str):
+        """Delete one temporary file as soon as it is no longer needed.
+        
+        Args:
+            file_path: Path of a file created during splitting.
+        """
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass  # Already swept up by cleanup_temp_files()
+        except OSError as e:
+            logging.warning(f"Failed to remove temp file {file_path}: {e}")
+            return
+        
+        with self._temp_files_lock:
+            try:
+                self.temp_files.remove(file_path)
+            except ValueError:
+                pass
     
     def cleanup_temp_files(self):
         """Clean up temporary files created during splitting."""
-        for temp_path in self.temp_files:
+        with self._temp_files_lock:
+            temp_paths = list(self.temp_files)
+            self.temp_files.clear()
+        
+        for temp_path in temp_paths:
             try:
                 if os.path.isfile(temp_path):
                     os.remove(temp_path)
                 elif os.path.isdir(temp_path):
-                    import shutil
                     shutil.rmtree(temp_path)
             except Exception as e:
                 logging.warning(f"Failed to cleanup temp file {temp_path}: {e}")
         
-        self.temp_files.clear()
         logging.info("Temporary files cleaned up")
     
-    def combine_transcriptions(self, transcriptions: List[str]) -> str:
+    def combine_transcriptions(self, transcriptions: Iterable[str]) -> str:
         """Combine multiple transcriptions into a single text.
         
+        Transcriptions are consumed one at a time, so a generator can stream
+        chunk results in as they finish.
+        
         Args:
-            transcriptions: List of transcription strings from chunks.
+            transcriptions: Transcription strings from chunks, in order.
             
         Returns:
             Combined transcription text.
         """
-        if not transcriptions:
-            return ""
-        
-        # Remove any empty transcriptions
-        valid_transcriptions = [t.strip() for t in transcriptions if t.strip()]
-        
-        if not valid_transcriptions:
-            return ""
-        
-        # Combine with space separation, handling sentence boundaries
-        combined = ""
-        for i, transcription in enumerate(valid_transcriptions):
-            if i > 0:
-                # Add space between chunks, but avoid double spaces
-                if not combined.endswith(" ") and not transcription.startswith(" "):
-                    combined += " "
-            
-            combined += transcription
+        # Combine with space separation, skipping empty transcriptions
+        parts = []
+        for transcription in transcriptions:
+            transcription = transcription.strip()
+            if transcription:
+                parts.append(transcription)
+        combined = " ".join(parts)
         
         # Clean up any double spaces
         while "  " in combined:
             combined = combined.replace("  ", " ")
         
-        return combined.strip()
+        return combined
 
 
 # Global instance for easy access
@@ -57,9 +57,17 @@ class AppConfig:
     
     # Timing settings
     HOTKEY_DEBOUNCE_MS: int = 300
+    # Repeat key events closer together than this are treated as switch chatter
+    HOTKEY_CHATTER_MS: int = 5
     OVERLAY_HIDE_DELAY_MS: int = 1500
     CANCELLATION_ANIMATION_DURATION_MS: int = 800
     PROGRESS_BAR_INTERVAL_MS: int = 10
+    # How often the UI applies the latest audio level to the overlay (~60 Hz)
+    AUDIO_LEVEL_PUMP_MS: int = 16
+    # How often chunk progress from the workers is shown (~5 Hz)
+    CHUNK_PROGRESS_POLL_MS: int = 200
+    # Shut the chunk worker pool down after this long without work
+    WORKER_POOL_IDLE_TIMEOUT_SEC: float = 30.0
     # Continue capturing this many ms after stop to avoid end cut-offs
     POST_ROLL_MS: int = 1200
     
@@ -4,10 +4,81 @@ Hotkey management for the Audio Recorder application.
 import keyboard
 import time
 import logging
-from typing import Dict, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Callable, Optional, Tuple, FrozenSet, List
 from config import config
 
 
+# Modifier bits used by the precompiled hotkey masks
+MOD_CTRL = 1
+MOD_ALT = 2
+MOD_SHIFT = 4
+MOD_WIN = 8
+
+_MODIFIER_BITS = {
+    'ctrl': MOD_CTRL,
+    'alt': MOD_ALT,
+    'shift': MOD_SHIFT,
+    'win': MOD_WIN,
+}
+
+# Key names reported by the keyboard library for each modifier bit
+_MODIFIER_KEY_NAMES = {
+    'ctrl': MOD_CTRL, 'left ctrl': MOD_CTRL, 'right ctrl': MOD_CTRL,
+    'alt': MOD_ALT, 'left alt': MOD_ALT, 'right alt': MOD_ALT, 'alt gr': MOD_ALT,
+    'shift': MOD_SHIFT, 'left shift': MOD_SHIFT, 'right shift': MOD_SHIFT,
+    'windows': MOD_WIN, 'left windows': MOD_WIN, 'right windows': MOD_WIN,
+}
+
+_ALL_MODS = MOD_CTRL | MOD_ALT | MOD_SHIFT | MOD_WIN
+
+# Modifiers a key mapping can need to produce its character; AltGr is
+# reported as ctrl+alt on Windows
+_MAPPING_MODIFIER_BITS = {
+    'shift': MOD_SHIFT,
+    'alt gr': MOD_CTRL | MOD_ALT,
+}
+
+# Per-hotkey press states for chatter filtering
+KEY_IDLE = 0
+KEY_CONFIRM_DOWN = 1
+KEY_HELD = 2
+KEY_CONFIRM_UP = 3
+
+# (unmodified main key scan codes, scan codes that need a modifier, main key name,
+#  required modifier mask, forbidden modifier mask, forbidden mask when matched by name)
+CompiledHotkey = Tuple[FrozenSet[int], FrozenSet[int], str, int, int, int]
+
+
+def _map_key_name(key: str) -> List[Tuple[int, Tuple[str, ...]]]:
+    """Resolve a key name to its (scan code, modifiers) mappings.
+
+    keyboard.key_to_scan_codes() drops the modifiers, so '*' would also
+    resolve to the scan code of '8', which only gives '*' with shift held.
+
+    Args:
+        key: Key name (e.g., "*", "f1").
+
+    Returns:
+        List of (scan_code, modifiers) tuples.
+
+    Raises:
+        ValueError: If the key is not mapped to any known key.
+    """
+    os_keyboard = getattr(keyboard, '_os_keyboard', None)
+    if os_keyboard is None or not hasattr(os_keyboard, 'map_name'):
+        return [(scan_code, ()) for scan_code in keyboard.key_to_scan_codes(key)]
+
+    try:
+        entries = [(scan_code, tuple(modifiers or ()))
+                   for scan_code, modifiers in os_keyboard.map_name(keyboard.normalize_name(key))]
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Key {key!r} is not mapped to any known key") from e
+    if not entries:
+        raise ValueError(f"Key {key!r} is not mapped to any known key")
+    return entries
+
+
 class HotkeyManager:
     """Manages global hotkeys and keyboard event handling."""
     
@@ -19,7 +90,19 @@ class HotkeyManager:
         """
         self.hotkeys = hotkeys or config.DEFAULT_HOTKEYS.copy()
         self.program_enabled = True
-        self._last_trigger_time = 0
+        # Debounce window in monotonic nanoseconds; first press fires immediately
+        self._debounce_ns = int(config.HOTKEY_DEBOUNCE_MS * 1_000_000)
+        self._last_trigger_ns = -self._debounce_ns
+        self._chatter_ns = int(config.HOTKEY_CHATTER_MS * 1_000_000)
+        self._mod_mask = 0
+        self._held_mods: Dict[Tuple[int, str], int] = {}
+        self._mod_scan_codes = self._resolve_modifier_scan_codes()
+        self._compiled: Dict[str, Optional[CompiledHotkey]] = {}
+        self._fsm: Dict[str, int] = {}
+        self._fsm_ts: Dict[str, int] = {}
+        self._watched_scan_codes: FrozenSet[int] = frozenset()
+        self._watched_names: FrozenSet[str] = frozenset()
+        self._hook_handle: Optional[Callable] = None
         
         # Callback functions
         self.on_record_toggle: Optional[Callable] = None
@@ -29,55 +112,219 @@ class HotkeyManager:
         self.on_status_update_auto_hide: Optional[Callable] = None
         self.is_transcribing_fn: Optional[Callable[[], bool]] = None
         
+        # Persistent workers so callbacks don't spawn a thread per key press
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hotkey-cb")
+        
         # Setup keyboard hook
         self._setup_keyboard_hook()
     
     def _setup_keyboard_hook(self):
         """Setup the global keyboard hook."""
-        keyboard.hook(self._handle_keyboard_event, suppress=True)
+        self._compile_hotkeys()
+        self._hook_handle = keyboard.hook(self._handle_keyboard_event, suppress=True)
+    
+    @staticmethod
+    def _resolve_modifier_scan_codes() -> Dict[int, int]:
+        """Map the scan codes of every modifier key to its modifier bit.
+        
+        Returns:
+            Dictionary of scan code to modifier bit. Modifiers that cannot be
+            resolved are left out and matched by key name instead.
+        """
+        mod_scan_codes = {}
+        for key_name, mod_bit in _MODIFIER_KEY_NAMES.items():
+            try:
+                for scan_code in keyboard.key_to_scan_codes(key_name):
+                    mod_scan_codes[scan_code] = mod_bit
+            except Exception:
+                continue
+        return mod_scan_codes
+    
+    def _compile_hotkeys(self):
+        """Precompile every configured hotkey string for fast matching.
+        
+        The running hook reads these tables on every event, so each one is
+        built first and then swapped in with a single assignment.
+        """
+        compiled = {name: self._compile_hotkey(hotkey_string)
+                    for name, hotkey_string in self.hotkeys.items()}
+        resolved = [c for c in compiled.values() if c is not None]
+        
+        self._compiled = compiled
+        # Main keys the hook cares about; everything else passes straight through
+        self._watched_scan_codes = frozenset().union(*(c[0] | c[1] for c in resolved))
+        self._watched_names = frozenset(c[2] for c in resolved if c[1] or not c[0])
+        self._fsm_ts = {name: 0 for name in compiled}
+        self._fsm = {name: KEY_IDLE for name in compiled}
+    
+    @staticmethod
+    def _compile_hotkey(hotkey_string: str) -> Optional[CompiledHotkey]:
+        """Compile a hotkey string into scan codes and modifier bitmasks.
+        
+        Args:
+            hotkey_string: Hotkey string (e.g., "ctrl+alt+*", "*", "shift+f1").
+            
+        Keys that only produce their character with a modifier (e.g. '*' as
+        shift+8) keep those scan codes out of the direct match and are
+        matched by key name instead, with that modifier allowed.
+        
+        Returns:
+            Tuple of (scan_codes, modified_scan_codes, main_key, required_mask,
+            forbidden_mask, name_forbidden_mask), or None if the hotkey string
+            is empty.
+        """
+        if not hotkey_string:
+            return None
+        
+        # Parse hotkey string (e.g., "ctrl+alt+*", "*", "shift+f1")
+        parts = hotkey_string.lower().split('+')
+        main_key = parts[-1]  # Last part is the main key
+        
+        required = 0
+        for modifier in parts[:-1]:
+            required |= _MODIFIER_BITS.get(modifier, 0)
+        
+        forbidden = _ALL_MODS & ~required
+        try:
+            entries = _map_key_name(main_key)
+        except Exception as e:
+            # Fall back to matching on the key name only
+            logging.warning(f"Could not resolve scan codes for '{main_key}': {e}")
+            entries = []
+        
+        scan_codes = frozenset(code for code, modifiers in entries if not modifiers)
+        modified_scan_codes = frozenset(code for code, modifiers in entries if modifiers) - scan_codes
+        
+        # Matched by name, the modifiers that produce the character are allowed
+        mapping_mods = 0
+        for _, modifiers in entries:
+            for modifier in modifiers:
+                mapping_mods |= _MAPPING_MODIFIER_BITS.get(modifier, 0)
+        name_forbidden = forbidden & ~mapping_mods
+        
+        return scan_codes, modified_scan_codes, main_key, required, forbidden, name_forbidden
     
     def _handle_keyboard_event(self, event):
         """Global keyboard event handler with suppression."""
-        if event.event_type == keyboard.KEY_DOWN:
+        # Track modifier state ourselves instead of polling keyboard.is_pressed()
+        mod_bit = self._mod_scan_codes.get(event.scan_code) or _MODIFIER_KEY_NAMES.get(event.name)
+        if mod_bit:
+            # Keyed by scan code and name: on Windows left and right ctrl/alt
+            # share a scan code and only differ by name, so releasing one
+            # keeps the other held
+            key = (event.scan_code, event.name)
+            if event.event_type == keyboard.KEY_DOWN:
+                self._held_mods[key] = mod_bit
+            else:
+                self._held_mods.pop(key, None)
+            mask = 0
+            for bit in self._held_mods.values():
+                mask |= bit
+            self._mod_mask = mask
+            return True
+        
+        # Fast path for ordinary typing: not a main key of any hotkey
+        if event.scan_code not in self._watched_scan_codes and event.name not in self._watched_names:
+            return True
+        
+        if event.event_type == keyboard.KEY_UP:
+            self._release_hotkeys(event)
+        
+        elif event.event_type == keyboard.KEY_DOWN:
             # Check enable/disable hotkey
-            if self._matches_hotkey(event, self.hotkeys['enable_disable']):
-                self._toggle_program_enabled()
+            if self._matches_hotkey(event, 'enable_disable'):
+                if self._confirm_press('enable_disable'):
+                    self._toggle_program_enabled()
                 return False  # Suppress the key combination
 
             # If program is disabled, only allow enable/disable hotkey
             if not self.program_enabled:
-                if not self._matches_hotkey(event, self.hotkeys['enable_disable']):
+                if not self._matches_hotkey(event, 'enable_disable'):
                     return True
 
             # Check record toggle hotkey
-            elif self._matches_hotkey(event, self.hotkeys['record_toggle']):
+            elif self._matches_hotkey(event, 'record_toggle'):
                 # Always suppress record toggle key first
-                suppress = False
-                if self._should_trigger_record_toggle():
+                if self._confirm_press('record_toggle') and self._should_trigger_record_toggle():
                     if self.on_record_toggle:
-                        # Run callback in a separate thread to avoid blocking
-                        import threading
-                        threading.Thread(target=self.on_record_toggle, daemon=True).start()
+                        # Run callback on a worker thread to avoid blocking
+                        self._submit_callback(self.on_record_toggle)
                 return False  # Always suppress record toggle key
 
             # Check cancel hotkey
-            elif self._matches_hotkey(event, self.hotkeys['cancel']):
-                if self.on_cancel:
-                    # Run callback in a separate thread to avoid blocking
-                    import threading
-                    threading.Thread(target=self.on_cancel, daemon=True).start()
+            elif self._matches_hotkey(event, 'cancel'):
+                if self._confirm_press('cancel') and self.on_cancel:
+                    # Run callback on a worker thread to avoid blocking
+                    self._submit_callback(self.on_cancel)
                 return False  # Suppress cancel key when handling
 
         # Let all other keys pass through
         return True
     
+    def _confirm_press(self, hotkey_name: str) -> bool:
+        """Advance a hotkey's press state on a matching KEY_DOWN.
+        
+        Only the first KEY_DOWN of a physical press fires. Auto-repeat and
+        KEY_DOWNs that bounce back within the chatter window after a release
+        are treated as the same press.
+        
+        Args:
+            hotkey_name: Name of the matched hotkey.
+            
+        Returns:
+            True if this event is a new press that should fire the hotkey.
+        """
+        now = time.monotonic_ns()
+        state = self._fsm.get(hotkey_name, KEY_IDLE)
+        
+        if state in (KEY_CONFIRM_DOWN, KEY_HELD):
+            self._fsm[hotkey_name] = KEY_HELD
+            return False
+        
+        if state == KEY_CONFIRM_UP and now - self._fsm_ts[hotkey_name] <= self._chatter_ns:
+            # Release chattered back to pressed; still the same press
+            self._fsm[hotkey_name] = KEY_HELD
+            return False
+        
+        self._fsm[hotkey_name] = KEY_CONFIRM_DOWN
+        self._fsm_ts[hotkey_name] = now
+        return True
+    
+    def _release_hotkeys(self, event):
+        """Advance press states for hotkeys whose main key was released.
+        
+        Args:
+            event: KEY_UP event from the keyboard library.
+        """
+        for hotkey_name, state in self._fsm.items():
+            if state not in (KEY_CONFIRM_DOWN, KEY_HELD):
+                continue
+            scan_codes, modified_scan_codes, main_key, _, _, _ = self._compiled[hotkey_name]
+            # Modifiers may already be up, so only the main key is compared
+            if (event.scan_code in scan_codes or event.scan_code in modified_scan_codes
+                    or ((modified_scan_codes or not scan_codes) and event.name == main_key)):
+                self._fsm[hotkey_name] = KEY_CONFIRM_UP
+                self._fsm_ts[hotkey_name] = time.monotonic_ns()
+    
+    def _submit_callback(self, callback: Callable):
+        """Run a hotkey callback on the worker pool.
+        
+        Args:
+            callback: Callback function to run.
+        """
+        try:
+            self._executor.submit(callback)
+        except RuntimeError:
+            # Executor already shut down during cleanup
+            logging.debug("Hotkey callback dropped after cleanup")
+    
     def _toggle_program_enabled(self):
         """Toggle the program enabled state."""
         old_state = self.program_enabled
         self.program_enabled = not self.program_enabled
         
         # Reset debounce timing when toggling to avoid stale state
-        self._last_trigger_time = 0
+        self._last_trigger_ns = -self._debounce_ns
         
         if self.on_status_update_auto_hide:
             if not self.program_enabled:
@@ -94,57 +341,41 @@ class HotkeyManager:
                 logging.info("STT has been enabled")
     
     def _should_trigger_record_toggle(self) -> bool:
-        """Check if record toggle should trigger (with debounce)."""
-        current_time = time.time()
-        if current_time - self._last_trigger_time > (config.HOTKEY_DEBOUNCE_MS / 1000.0):
-            self._last_trigger_time = current_time
+        """Check if record toggle should trigger (with leading-edge debounce)."""
+        now = time.monotonic_ns()
+        if now - self._last_trigger_ns > self._debounce_ns:
+            self._last_trigger_ns = now
             return True
         return False
     
-    def _matches_hotkey(self, event, hotkey_string: str) -> bool:
-        """Check if the current event matches a hotkey string.
+    def _matches_hotkey(self, event, hotkey_name: str) -> bool:
+        """Check if the current event matches a configured hotkey.
         
         Args:
             event: Keyboard event from the keyboard library.
-            hotkey_string: Hotkey string (e.g., "ctrl+alt+*", "*", "shift+f1").
+            hotkey_name: Name of the hotkey (e.g., "record_toggle").
             
         Returns:
-            True if the event matches the hotkey string.
+            True if the event matches the precompiled hotkey.
         """
-        if not hotkey_string:
+        compiled = self._compiled.get(hotkey_name)
+        if compiled is None:
             return False
-            
-        # Parse hotkey string (e.g., "ctrl+alt+*", "*", "shift+f1")
-        parts = hotkey_string.lower().split('+')
-        main_key = parts[-1]  # Last part is the main key
-        modifiers = parts[:-1]  # Everything else are modifiers
         
-        # Check if main key matches
-        if event.name.lower() != main_key:
-            return False
-            
-        # Check modifiers
-        for modifier in modifiers:
-            if modifier == 'ctrl' and not keyboard.is_pressed('ctrl'):
-                return False
-            elif modifier == 'alt' and not keyboard.is_pressed('alt'):
-                return False
-            elif modifier == 'shift' and not keyboard.is_pressed('shift'):
-                return False
-            elif modifier == 'win' and not keyboard.is_pressed('win'):
-                return False
-                
-        # Check that no extra modifiers are pressed
-        if 'ctrl' not in modifiers and keyboard.is_pressed('ctrl'):
-            return False
-        if 'alt' not in modifiers and keyboard.is_pressed('alt'):
-            return False
-        if 'shift' not in modifiers and keyboard.is_pressed('shift'):
-            return False
-        if 'win' not in modifiers and keyboard.is_pressed('win'):
+        scan_codes, modified_scan_codes, main_key, required, forbidden, name_forbidden = compiled
+        
+        # Check if main key matches; keys that need a modifier to produce
+        # their character only match by name
+        if event.scan_code in scan_codes:
+            blocked = forbidden
+        elif (modified_scan_codes or not scan_codes) and event.name == main_key:
+            blocked = name_forbidden
+        else:
             return False
-            
-        return True
+        
+        # Required modifiers must be held and no extra modifiers pressed
+        mods = self._mod_mask
+        return (mods & required) == required and not (mods & blocked)
     
     def update_hotkeys(self, new_hotkeys: Dict[str, str]):
         """Update the hotkey mappings.
@@ -153,17 +384,28 @@ class HotkeyManager:
             new_hotkeys: Dictionary of new hotkey mappings.
         """
         self.hotkeys.update(new_hotkeys)
-        # Restart keyboard hook with new hotkeys
-        self.cleanup()
-        self._setup_keyboard_hook()
+        if self._hook_handle is None:
+            self._setup_keyboard_hook()
+        else:
+            # The installed hook picks up the recompiled tables on its next event
+            self._compile_hotkeys()
         logging.info("Hotkeys updated successfully")
     
-    def cleanup(self):
-        """Clean up keyboard hooks."""
+    def _remove_keyboard_hook(self):
+        """Remove our global keyboard hook, leaving other hooks in place."""
+        if self._hook_handle is None:
+            return
         try:
-            keyboard.unhook_all()
+            keyboard.unhook(self._hook_handle)
         except Exception as e:
             logging.error(f"Error cleaning up keyboard hooks: {e}")
+        finally:
+            self._hook_handle = None
+    
+    def cleanup(self):
+        """Clean up keyboard hooks and the callback workers."""
+        self._remove_keyboard_hook()
+        self._executor.shutdown(wait=False)
     
     def set_callbacks(self, 
                      on_record_toggle: Callable = None,
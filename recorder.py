@@ -6,6 +6,8 @@ import wave
 import threading
 import logging
 import numpy as np
+import os
+import tempfile
 import time
 
 from typing import List, Optional, Callable
@@ -64,7 +66,6 @@ class AudioRecorder:
             logging.info(f"Cleared recording frames. Old frame count: {len(self.frames)}")
             
             # Delete old audio file if it exists
-            import os
             if os.path.exists(config.RECORDED_AUDIO_FILE):
                 try:
                     os.remove(config.RECORDED_AUDIO_FILE)
@@ -216,8 +217,6 @@ class AudioRecorder:
         
         try:
             # Create a temporary file first, then rename for atomic operation
-            import tempfile
-            import os
             temp_fd, temp_path = tempfile.mkstemp(suffix='.wav', dir=os.path.dirname(filename))
             
             try:
@@ -233,7 +232,6 @@ class AudioRecorder:
                     os.remove(filename)
                 os.rename(temp_path, filename)
                 
-                import time
                 logging.info(f"Audio saved to {filename} at {time.strftime('%Y-%m-%d %H:%M:%S')} - {frame_count} frames, {total_bytes} bytes, {self.get_recording_duration():.2f}s")
                 return True
                 
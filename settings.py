@@ -1,11 +1,12 @@
 """
 Settings management for the Audio Recorder application.
 """
+import copy
 import json
 import os
 import logging
 import threading
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Optional
 from config import config
 
 
@@ -20,6 +21,19 @@ class SettingsManager:
         """
         self.settings_file = settings_file or config.SETTINGS_FILE
         self._lock = threading.Lock()
+        
+        # Parsed results of the frequently read sections; cleared on every write
+        self._hotkey_cache: Optional[Dict[str, str]] = None
+        self._waveform_cache: Optional[Tuple[str, Dict[str, Dict]]] = None
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached hotkey and waveform style settings.
+        
+        Writes through this manager invalidate automatically; call this
+        after the settings file may have been changed some other way.
+        """
+        self._hotkey_cache = None
+        self._waveform_cache = None
     
     def load_hotkey_settings(self) -> Dict[str, str]:
         """Load hotkey settings from file, return defaults if file doesn't exist.
@@ -27,15 +41,20 @@ class SettingsManager:
         Returns:
             Dictionary of hotkey mappings.
         """
+        if self._hotkey_cache is not None:
+            return self._hotkey_cache.copy()
+        
+        hotkeys = config.DEFAULT_HOTKEYS.copy()
         try:
             if os.path.exists(self.settings_file):
                 with open(self.settings_file, 'r') as f:
                     settings = json.load(f)
-                    return settings.get('hotkeys', config.DEFAULT_HOTKEYS)
+                    hotkeys = settings.get('hotkeys', hotkeys)
         except Exception as e:
             logging.warning(f"Failed to load settings: {e}")
         
-        return config.DEFAULT_HOTKEYS.copy()
+        self._hotkey_cache = hotkeys
+        return hotkeys.copy()
     
     def save_hotkey_settings(self, hotkeys: Dict[str, str]) -> None:
         """Save hotkey settings to file.
@@ -54,6 +73,9 @@ class SettingsManager:
         except Exception as e:
             logging.error(f"Failed to save settings: {e}")
             raise
+        finally:
+            # After the write, so a read in between can't re-cache the old file
+            self.invalidate_cache()
     
     def load_all_settings(self) -> Dict[str, Any]:
         """Load all settings from file.
@@ -86,6 +108,8 @@ class SettingsManager:
         except Exception as e:
             logging.error(f"Failed to save all settings: {e}")
             raise
+        finally:
+            self.invalidate_cache()
     
     def load_waveform_style_settings(self) -> Tuple[str, Dict[str, Dict]]:
         """Load waveform style settings from file.
@@ -95,38 +119,50 @@ class SettingsManager:
             Falls back to defaults if file doesn't exist or is corrupted.
         """
         with self._lock:
-            try:
-                if os.path.exists(self.settings_file):
-                    with open(self.settings_file, 'r') as f:
-                        settings = json.load(f)
-                        
-                    # Get current style
-                    current_style = settings.get('current_waveform_style', config.CURRENT_WAVEFORM_STYLE)
-                    
-                    # Get style configurations
-                    saved_configs = settings.get('waveform_style_configs', {})
-                    
-                    # Start with default configurations
-                    all_configs = config.WAVEFORM_STYLE_CONFIGS.copy()
-                    
-                    # Merge saved configurations, validating each style
-                    for style_name, saved_config in saved_configs.items():
-                        if style_name in all_configs and isinstance(saved_config, dict):
-                            # Update default config with saved values
-                            all_configs[style_name].update(saved_config)
+            if self._waveform_cache is None:
+                self._waveform_cache = self._read_waveform_style_settings()
+            current_style, all_configs = self._waveform_cache
+            # Callers may modify the configs, so never hand out the cached dicts
+            return current_style, copy.deepcopy(all_configs)
+    
+    def _read_waveform_style_settings(self) -> Tuple[str, Dict[str, Dict]]:
+        """Read waveform style settings from file.
+        
+        Returns:
+            Tuple containing (current_style, all_style_configs).
+        """
+        try:
+            if os.path.exists(self.settings_file):
+                with open(self.settings_file, 'r') as f:
+                    settings = json.load(f)
                     
-                    # Validate current style exists
-                    if current_style not in all_configs:
-                        logging.warning(f"Invalid current style '{current_style}', falling back to default")
-                        current_style = config.CURRENT_WAVEFORM_STYLE
+                # Get current style
+                current_style = settings.get('current_waveform_style', config.CURRENT_WAVEFORM_STYLE)
+                
+                # Get style configurations
+                saved_configs = settings.get('waveform_style_configs', {})
+                
+                # Start with default configurations
+                all_configs = copy.deepcopy(config.WAVEFORM_STYLE_CONFIGS)
+                
+                # Merge saved configurations, validating each style
+                for style_name, saved_config in saved_configs.items():
+                    if style_name in all_configs and isinstance(saved_config, dict):
+                        # Update default config with saved values
+                        all_configs[style_name].update(saved_config)
+                
+                # Validate current style exists
+                if current_style not in all_configs:
+                    logging.warning(f"Invalid current style '{current_style}', falling back to default")
+                    current_style = config.CURRENT_WAVEFORM_STYLE
+                
+                return current_style, all_configs
                     
-                    return current_style, all_configs
-                        
-            except Exception as e:
-                logging.warning(f"Failed to load waveform style settings: {e}")
-            
-            # Return defaults on any error
-            return config.CURRENT_WAVEFORM_STYLE, config.WAVEFORM_STYLE_CONFIGS.copy()
+        except Exception as e:
+            logging.warning(f"Failed to load waveform style settings: {e}")
+        
+        # Return defaults on any error
+        return config.CURRENT_WAVEFORM_STYLE, copy.deepcopy(config.WAVEFORM_STYLE_CONFIGS)
     
     def save_waveform_style_settings(self, current_style: str, style_configs: Dict[str, Dict]) -> None:
         """Save waveform style settings to file.
@@ -176,6 +212,8 @@ class SettingsManager:
             except Exception as e:
                 logging.error(f"Failed to save waveform style settings: {e}")
                 raise
+            finally:
+                self.invalidate_cache()
     
     def get_style_config(self, style_name: str) -> Dict[str, Any]:
         """Get configuration for a specific waveform style.
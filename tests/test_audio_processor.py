@@ -0,0 +1,138 @@
+"""
+Unit tests for the audio processor module.
+"""
+import unittest
+import tempfile
+import os
+import wave
+from unittest.mock import patch
+
+from audio_processor import AudioProcessor
+
+
+class TestCheckFileSize(unittest.TestCase):
+    """Test cases for AudioProcessor.check_file_size."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = AudioProcessor()
+        fd, self.audio_file = tempfile.mkstemp(suffix=".wav")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"\0" * 2048)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        if os.path.exists(self.audio_file):
+            os.remove(self.audio_file)
+
+    def test_small_file_needs_no_splitting(self):
+        """Test that a file under the limit is not split."""
+        needs_splitting, file_size_mb = self.processor.check_file_size(self.audio_file)
+        self.assertFalse(needs_splitting)
+        self.assertAlmostEqual(file_size_mb, 2048 / (1024 * 1024))
+
+    def test_missing_file_raises(self):
+        """Test that checking a missing file raises FileNotFoundError."""
+        os.remove(self.audio_file)
+        with self.assertRaises(FileNotFoundError):
+            self.processor.check_file_size(self.audio_file)
+
+    def test_uses_given_stat_result(self):
+        """Test that a caller-provided stat result skips the stat call."""
+        stat_result = os.stat(self.audio_file)
+        with patch('audio_processor.os.stat') as mock_stat:
+            self.processor.check_file_size(self.audio_file, stat_result)
+            mock_stat.assert_not_called()
+
+    def test_result_cached_until_file_changes(self):
+        """Test that results are reused until the file's size changes."""
+        first = self.processor.check_file_size(self.audio_file)
+        with patch('audio_processor.config') as mock_config:
+            # A cached result doesn't consult the limit again
+            mock_config.MAX_FILE_SIZE_MB = 0
+            self.assertEqual(self.processor.check_file_size(self.audio_file), first)
+
+            with open(self.audio_file, "ab") as f:
+                f.write(b"\0" * 1024)
+            needs_splitting, _ = self.processor.check_file_size(self.audio_file)
+            self.assertTrue(needs_splitting)
+
+
+class TestLoadAudioData(unittest.TestCase):
+    """Test cases for AudioProcessor._load_audio_data."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        fd, self.audio_file = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        with wave.open(self.audio_file, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(b"\1\0" * 100)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        if os.path.exists(self.audio_file):
+            os.remove(self.audio_file)
+
+    def test_loads_all_frames(self):
+        """Test that a complete file is loaded in full."""
+        audio_data, sample_rate = AudioProcessor()._load_audio_data(self.audio_file)
+        self.assertEqual(sample_rate, 16000)
+        self.assertEqual(len(audio_data), 100)
+
+    def test_truncated_file_loads_available_frames(self):
+        """Test that a file cut short of its header's frame count still loads."""
+        with open(self.audio_file, "r+b") as f:
+            f.truncate(os.path.getsize(self.audio_file) - 40)
+        audio_data, _ = AudioProcessor()._load_audio_data(self.audio_file)
+        self.assertEqual(len(audio_data), 80)
+        del audio_data
+
+
+class TestCombineTranscriptions(unittest.TestCase):
+    """Test cases for AudioProcessor.combine_transcriptions."""
+
+    def test_combines_in_order_skipping_empty(self):
+        """Test joining chunk texts with single spaces."""
+        processor = AudioProcessor()
+        combined = processor.combine_transcriptions([" Hello ", "", "big  world", "again"])
+        self.assertEqual(combined, "Hello big world again")
+
+    def test_accepts_generator(self):
+        """Test that chunk texts can be streamed in from a generator."""
+        processor = AudioProcessor()
+        combined = processor.combine_transcriptions(text for text in ("one", "two"))
+        self.assertEqual(combined, "one two")
+
+
+class TestRemoveTempFile(unittest.TestCase):
+    """Test cases for AudioProcessor.remove_temp_file."""
+
+    def test_removes_file_and_stops_tracking_it(self):
+        """Test that a removed chunk is no longer left for bulk cleanup."""
+        processor = AudioProcessor()
+        fd, chunk_file = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        processor.temp_files.append(chunk_file)
+
+        processor.remove_temp_file(chunk_file)
+
+        self.assertFalse(os.path.exists(chunk_file))
+        self.assertNotIn(chunk_file, processor.temp_files)
+
+    def test_already_removed_file_is_not_a_warning(self):
+        """Test that a chunk swept up by bulk cleanup is dropped quietly."""
+        processor = AudioProcessor()
+        chunk_file = os.path.join(tempfile.gettempdir(), "missing_chunk.wav")
+        processor.temp_files.append(chunk_file)
+
+        with patch('audio_processor.logging.warning') as mock_warning:
+            processor.remove_temp_file(chunk_file)
+            mock_warning.assert_not_called()
+        self.assertNotIn(chunk_file, processor.temp_files)
+
+
+if __name__ == '__main__':
+    unittest.main()
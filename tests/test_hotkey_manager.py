@@ -0,0 +1,225 @@
+"""
+Unit tests for the hotkey manager module.
+"""
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import keyboard
+
+from hotkey_manager import HotkeyManager, MOD_CTRL, MOD_ALT
+
+
+# Fake scan codes for the keys used in the tests
+FAKE_SCAN_CODES = {
+    'w': (17,),
+    'o': (24,),
+    'esc': (1,),
+    'f1': (59,),
+}
+
+
+# Fake (scan code, modifiers) mappings; '*' is shift+8 or numpad *, as on Windows
+FAKE_KEY_MAP = {
+    'w': [(17, ())],
+    'o': [(24, ())],
+    'esc': [(1, ())],
+    'f1': [(59, ())],
+    '*': [(9, ('shift',)), (55, ())],
+}
+
+
+def fake_key_to_scan_codes(key):
+    """Resolve key names without touching the OS keymap."""
+    if key not in FAKE_SCAN_CODES:
+        raise ValueError(f"Unknown key {key}")
+    return FAKE_SCAN_CODES[key]
+
+
+def fake_map_key_name(key):
+    """Resolve key names to (scan code, modifiers) without touching the OS keymap."""
+    if key not in FAKE_KEY_MAP:
+        raise ValueError(f"Unknown key {key}")
+    return FAKE_KEY_MAP[key]
+
+
+def make_event(name, scan_code=None, event_type=keyboard.KEY_DOWN):
+    """Create a minimal stand-in for keyboard.KeyboardEvent."""
+    return SimpleNamespace(name=name, scan_code=scan_code, event_type=event_type)
+
+
+class TestHotkeyManager(unittest.TestCase):
+    """Test cases for the HotkeyManager class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.hook_patcher = patch('hotkey_manager.keyboard.hook')
+        self.unhook_patcher = patch('hotkey_manager.keyboard.unhook')
+        self.scan_patcher = patch('hotkey_manager.keyboard.key_to_scan_codes',
+                                  side_effect=fake_key_to_scan_codes)
+        self.map_patcher = patch('hotkey_manager._map_key_name', side_effect=fake_map_key_name)
+        self.mock_hook = self.hook_patcher.start()
+        self.mock_unhook = self.unhook_patcher.start()
+        self.scan_patcher.start()
+        self.map_patcher.start()
+
+        self.manager = HotkeyManager({
+            'record_toggle': 'ctrl+alt+w',
+            'cancel': 'esc',
+            'enable_disable': 'ctrl+alt+o'
+        })
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.manager.cleanup()
+        self.map_patcher.stop()
+        self.scan_patcher.stop()
+        self.unhook_patcher.stop()
+        self.hook_patcher.stop()
+
+    def test_compile_hotkey(self):
+        """Test compiling a hotkey string into scan codes and masks."""
+        scan_codes, modified_scan_codes, main_key, required, forbidden, _ = \
+            HotkeyManager._compile_hotkey('ctrl+alt+w')
+        self.assertEqual(scan_codes, frozenset({17}))
+        self.assertEqual(modified_scan_codes, frozenset())
+        self.assertEqual(main_key, 'w')
+        self.assertEqual(required, MOD_CTRL | MOD_ALT)
+        self.assertFalse(required & forbidden)
+
+    def test_compile_empty_hotkey(self):
+        """Test that an empty hotkey string compiles to None."""
+        self.assertIsNone(HotkeyManager._compile_hotkey(''))
+
+    def test_matches_with_modifiers(self):
+        """Test matching a hotkey once its modifiers are held."""
+        event = make_event('w', 17)
+        self.assertFalse(self.manager._matches_hotkey(event, 'record_toggle'))
+
+        self.manager._handle_keyboard_event(make_event('left ctrl', 29))
+        self.manager._handle_keyboard_event(make_event('alt', 56))
+        self.assertTrue(self.manager._matches_hotkey(event, 'record_toggle'))
+
+    def test_extra_modifier_rejected(self):
+        """Test that extra modifiers prevent a match."""
+        self.manager._handle_keyboard_event(make_event('shift', 42))
+        self.assertFalse(self.manager._matches_hotkey(make_event('esc', 1), 'cancel'))
+
+        self.manager._handle_keyboard_event(make_event('shift', 42, keyboard.KEY_UP))
+        self.assertTrue(self.manager._matches_hotkey(make_event('esc', 1), 'cancel'))
+
+    def test_unresolved_key_falls_back_to_name(self):
+        """Test matching by key name when scan codes cannot be resolved."""
+        self.manager.update_hotkeys({'cancel': 'pause'})
+        self.assertTrue(self.manager._matches_hotkey(make_event('pause', 999), 'cancel'))
+        self.assertFalse(self.manager._matches_hotkey(make_event('esc', 1), 'cancel'))
+
+    def test_shifted_key_matches_by_name_only(self):
+        """Test that '*' doesn't fire on a plain '8' but does on shift+8."""
+        self.manager.update_hotkeys({'cancel': '*'})
+        self.assertFalse(self.manager._matches_hotkey(make_event('8', 9), 'cancel'))
+
+        self.manager._handle_keyboard_event(make_event('shift', 42))
+        self.assertTrue(self.manager._matches_hotkey(make_event('*', 9), 'cancel'))
+        # Shift is only allowed when it produces the character
+        self.assertFalse(self.manager._matches_hotkey(make_event('*', 55), 'cancel'))
+
+        self.manager._handle_keyboard_event(make_event('shift', 42, keyboard.KEY_UP))
+        self.assertTrue(self.manager._matches_hotkey(make_event('*', 55), 'cancel'))
+
+    def test_plain_8_passes_through_with_star_hotkey(self):
+        """Test that typing '8' isn't swallowed by a '*' hotkey."""
+        self.manager.update_hotkeys({'cancel': '*'})
+        self.assertTrue(self.manager._handle_keyboard_event(make_event('8', 9)))
+
+    def test_record_toggle_runs_callback_on_worker(self):
+        """Test that the record toggle hotkey submits its callback."""
+        called = threading.Event()
+        self.manager.set_callbacks(on_record_toggle=called.set)
+
+        self.manager._handle_keyboard_event(make_event('ctrl', 29))
+        self.manager._handle_keyboard_event(make_event('alt', 56))
+        suppress = self.manager._handle_keyboard_event(make_event('w', 17))
+
+        self.assertFalse(suppress)
+        self.assertTrue(called.wait(1.0))
+
+    def test_callback_after_cleanup_is_dropped(self):
+        """Test that callbacks submitted after cleanup don't raise."""
+        self.manager.cleanup()
+        self.manager._submit_callback(lambda: None)
+
+    def test_record_toggle_debounce(self):
+        """Test that the first press fires and a quick repeat is debounced."""
+        self.assertTrue(self.manager._should_trigger_record_toggle())
+        self.assertFalse(self.manager._should_trigger_record_toggle())
+
+        # Pretend the last trigger happened well outside the debounce window
+        self.manager._last_trigger_ns -= 2 * self.manager._debounce_ns
+        self.assertTrue(self.manager._should_trigger_record_toggle())
+
+    def test_chatter_fires_once(self):
+        """Test that repeated KEY_DOWNs from one press fire only once."""
+        calls = []
+        self.manager._submit_callback = calls.append
+        self.manager.set_callbacks(on_cancel='cancel')
+
+        # Press, bounce, and auto-repeat all belong to one physical press
+        self.manager._handle_keyboard_event(make_event('esc', 1))
+        self.manager._handle_keyboard_event(make_event('esc', 1, keyboard.KEY_UP))
+        self.manager._handle_keyboard_event(make_event('esc', 1))
+        self.manager._handle_keyboard_event(make_event('esc', 1))
+        self.assertEqual(calls, ['cancel'])
+
+        # A press after the release settles fires again
+        self.manager._handle_keyboard_event(make_event('esc', 1, keyboard.KEY_UP))
+        self.manager._fsm_ts['cancel'] -= 2 * self.manager._chatter_ns
+        self.manager._handle_keyboard_event(make_event('esc', 1))
+        self.assertEqual(calls, ['cancel', 'cancel'])
+
+    def test_unwatched_keys_pass_through(self):
+        """Test that keys outside every hotkey skip hotkey matching."""
+        with patch.object(self.manager, '_matches_hotkey') as mock_matches:
+            self.assertTrue(self.manager._handle_keyboard_event(make_event('f1', 59)))
+            mock_matches.assert_not_called()
+
+    def test_left_right_modifiers_tracked_separately(self):
+        """Test that releasing one ctrl key keeps the other one held."""
+        # Windows reports both ctrl keys with scan code 29
+        self.manager._handle_keyboard_event(make_event('ctrl', 29))
+        self.manager._handle_keyboard_event(make_event('right ctrl', 29))
+        self.manager._handle_keyboard_event(make_event('ctrl', 29, keyboard.KEY_UP))
+        self.assertEqual(self.manager._mod_mask, MOD_CTRL)
+
+        self.manager._handle_keyboard_event(make_event('right ctrl', 29, keyboard.KEY_UP))
+        self.assertEqual(self.manager._mod_mask, 0)
+
+    def test_left_right_alt_tracked_separately(self):
+        """Test that releasing one alt key keeps the other one held."""
+        # Windows reports both alt keys with scan code 56
+        self.manager._handle_keyboard_event(make_event('alt', 56))
+        self.manager._handle_keyboard_event(make_event('right alt', 56))
+        self.manager._handle_keyboard_event(make_event('right alt', 56, keyboard.KEY_UP))
+        self.assertEqual(self.manager._mod_mask, MOD_ALT)
+
+        self.manager._handle_keyboard_event(make_event('alt', 56, keyboard.KEY_UP))
+        self.assertEqual(self.manager._mod_mask, 0)
+
+    def test_update_hotkeys_keeps_hook(self):
+        """Test that updating hotkeys recompiles without re-hooking."""
+        self.manager.update_hotkeys({'cancel': 'f1'})
+
+        self.mock_hook.assert_called_once()
+        self.mock_unhook.assert_not_called()
+        self.assertTrue(self.manager._matches_hotkey(make_event('f1', 59), 'cancel'))
+
+    def test_cleanup_removes_only_own_hook(self):
+        """Test that cleanup unhooks the handle returned by keyboard.hook."""
+        handle = self.mock_hook.return_value
+        self.manager.cleanup()
+        self.mock_unhook.assert_called_once_with(handle)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -103,6 +103,38 @@ class TestSettingsManager(unittest.TestCase):
         
         self.assertEqual(saved_data, test_settings)
 
+    def test_hotkey_settings_cached_until_save(self):
+        """Test that hotkey settings are read once and refreshed on save."""
+        self.settings_manager.save_hotkey_settings({'record_toggle': 'f1'})
+        self.assertEqual(self.settings_manager.load_hotkey_settings(), {'record_toggle': 'f1'})
+        
+        # External edits are not seen until the cache is invalidated
+        with open(self.test_settings_file, 'w') as f:
+            json.dump({'hotkeys': {'record_toggle': 'f2'}}, f)
+        self.assertEqual(self.settings_manager.load_hotkey_settings(), {'record_toggle': 'f1'})
+        
+        self.settings_manager.invalidate_cache()
+        self.assertEqual(self.settings_manager.load_hotkey_settings(), {'record_toggle': 'f2'})
+    
+    def test_waveform_settings_cache_returns_copies(self):
+        """Test that modifying loaded waveform configs doesn't affect the cache."""
+        _, configs = self.settings_manager.load_waveform_style_settings()
+        configs['modern']['bar_count'] = 999
+        
+        _, reloaded = self.settings_manager.load_waveform_style_settings()
+        self.assertEqual(reloaded['modern']['bar_count'],
+                         config.WAVEFORM_STYLE_CONFIGS['modern']['bar_count'])
+    
+    def test_save_waveform_settings_invalidates_cache(self):
+        """Test that saving waveform settings is visible on the next load."""
+        _, configs = self.settings_manager.load_waveform_style_settings()
+        configs['retro']['bar_count'] = 8
+        self.settings_manager.save_waveform_style_settings('retro', configs)
+        
+        current_style, reloaded = self.settings_manager.load_waveform_style_settings()
+        self.assertEqual(current_style, 'retro')
+        self.assertEqual(reloaded['retro']['bar_count'], 8)
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Unit tests for the worker pool module.
+"""
+import threading
+import time
+import unittest
+
+from worker_pool import WorkerPoolContext
+
+
+class TestWorkerPoolContext(unittest.TestCase):
+    """Test cases for the WorkerPoolContext class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.context = WorkerPoolContext(idle_timeout_sec=60)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.context.shutdown()
+
+    def test_pool_reused_between_jobs(self):
+        """Test that consecutive jobs share one pool."""
+        with self.context.pool(2) as first:
+            self.assertEqual(first.submit(lambda: 42).result(), 42)
+        with self.context.pool(2) as second:
+            self.assertIs(first, second)
+
+    def test_idle_pool_grows_on_demand(self):
+        """Test that an unused pool is replaced when more workers are needed."""
+        with self.context.pool(1) as small:
+            pass
+        with self.context.pool(4) as large:
+            self.assertIsNot(small, large)
+
+    def test_busy_pool_shared_at_current_size(self):
+        """Test that a pool in use is shared rather than replaced."""
+        with self.context.pool(1) as outer:
+            with self.context.pool(4) as inner:
+                self.assertIs(outer, inner)
+
+    def _max_concurrency(self, pool, tasks=4):
+        """Run tasks on a pool and return how many ever ran at once."""
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def task():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        for future in [pool.submit(task) for _ in range(tasks)]:
+            future.result()
+        return peak[0]
+
+    def test_idle_pool_shrinks_to_requested_size(self):
+        """Test that a job asking for one worker never runs two tasks at once."""
+        with self.context.pool(4) as large:
+            self.assertGreater(self._max_concurrency(large), 1)
+        with self.context.pool(1) as small:
+            self.assertEqual(self._max_concurrency(small), 1)
+
+    def test_busy_large_pool_not_shared_with_smaller_request(self):
+        """Test that a smaller request gets its own pool while a larger one is busy."""
+        with self.context.pool(4) as outer:
+            with self.context.pool(1) as inner:
+                self.assertIsNot(outer, inner)
+                self.assertEqual(self._max_concurrency(inner), 1)
+
+    def test_idle_timeout_shuts_pool_down(self):
+        """Test that the pool is dropped once the idle timer fires."""
+        with self.context.pool(1) as pool:
+            pass
+        self.context._idle_timer.cancel()
+        self.context._shutdown_if_idle()
+
+        with self.context.pool(1) as new_pool:
+            self.assertIsNot(pool, new_pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,11 +2,22 @@
 Base transcription backend interface.
 """
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List
+from audio_processor import audio_processor
 
 
 class TranscriptionBackend(ABC):
-    """Abstract base class for transcription backends."""
+    """Abstract base class for transcription backends.
+    
+    Backends that can split one long file across several processors
+    themselves (e.g. whisper.cpp's whisper_full_parallel) may also define
+    ``transcribe_parallel(audio_file_path, n_processors) -> str``; large
+    files are then handed to it whole instead of being split into chunks.
+    """
+    
+    # Maximum chunks transcribed concurrently by the default transcribe_chunks()
+    parallel_chunks: int = 4
     
     def __init__(self):
         """Initialize the transcription backend."""
@@ -49,8 +60,10 @@ class TranscriptionBackend(ABC):
         """Transcribe multiple audio chunk files and combine results.
         
         This is an optional method that backends can implement for optimized
-        handling of chunked audio. If not implemented, the main UI will
-        fall back to calling transcribe() for each chunk individually.
+        handling of chunked audio. The default implementation calls
+        transcribe() for up to ``parallel_chunks`` chunks at a time, which
+        suits I/O-bound backends; CPU-bound backends should lower
+        ``parallel_chunks`` or override this method.
         
         Args:
             chunk_files: List of paths to audio chunk files.
@@ -61,16 +74,26 @@ class TranscriptionBackend(ABC):
         Raises:
             Exception: If transcription fails.
         """
-        # Default implementation: transcribe each chunk and combine
-        from audio_processor import audio_processor
+        # Default implementation: transcribe chunks concurrently and combine in order
+        if self.should_cancel:
+            raise Exception("Transcription cancelled")
         
-        transcriptions = []
-        for chunk_file in chunk_files:
-            if self.should_cancel:
-                raise Exception("Transcription cancelled")
-            
-            chunk_text = self.transcribe(chunk_file)
-            transcriptions.append(chunk_text)
+        transcriptions: List[Optional[str]] = [None] * len(chunk_files)
+        max_workers = max(1, min(self.parallel_chunks, len(chunk_files)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chunk") as executor:
+            futures = {executor.submit(self.transcribe, chunk_file): index
+                       for index, chunk_file in enumerate(chunk_files)}
+            try:
+                for future in as_completed(futures):
+                    if self.should_cancel:
+                        raise Exception("Transcription cancelled")
+                    transcriptions[futures[future]] = future.result()
+            except BaseException:
+                # Drop chunks that haven't started yet
+                for future in futures:
+                    future.cancel()
+                raise
         
         return audio_processor.combine_transcriptions(transcriptions)
     
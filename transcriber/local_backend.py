@@ -6,18 +6,61 @@ import logging
 import os
 import subprocess
 import platform
-from typing import Optional, List
+import shutil
+from typing import Optional, List, Dict, Tuple
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from .base import TranscriptionBackend
+from audio_processor import audio_processor
 from config import config
 from settings import settings_manager
 
 
+# Results of `ffmpeg -version` probes keyed on (path, mtime_ns, size)
+_ffmpeg_probe_cache: Dict[Tuple[str, int, int], bool] = {}
+
+# Avoid allocating a console window for the probe on Windows
+_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
 class FFmpegManager:
     """Manages ffmpeg detection and configuration."""
     
+    @staticmethod
+    def verify_ffmpeg(ffmpeg_path: str) -> bool:
+        """Check that a path points to a working ffmpeg executable.
+        
+        Results are cached on the executable's path, modification time and
+        size, so repeat checks of an unchanged file skip the subprocess.
+        
+        Args:
+            ffmpeg_path: Path to the executable, or a command name on PATH.
+            
+        Returns:
+            True if the executable runs and reports an ffmpeg version.
+            
+        Raises:
+            OSError: If the executable cannot be found or run.
+            subprocess.SubprocessError: If the probe times out.
+        """
+        resolved = shutil.which(ffmpeg_path) or ffmpeg_path
+        stat = os.stat(resolved)
+        key = (resolved, stat.st_mtime_ns, stat.st_size)
+        
+        cached = _ffmpeg_probe_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = subprocess.run([resolved, '-version'],
+                              capture_output=True,
+                              text=True,
+                              timeout=5,
+                              creationflags=_NO_WINDOW)
+        is_valid = result.returncode == 0 and 'ffmpeg version' in result.stdout.lower()
+        _ffmpeg_probe_cache[key] = is_valid
+        return is_valid
+    
     @staticmethod
     def detect_ffmpeg() -> Optional[str]:
         """Detect if ffmpeg is available in PATH.
@@ -27,14 +70,10 @@ class FFmpegManager:
         """
         try:
             # Try to run ffmpeg -version
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=5)
-            if result.returncode == 0:
+            if FFmpegManager.verify_ffmpeg('ffmpeg'):
                 # ffmpeg found in PATH
                 return 'ffmpeg'
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+        except (OSError, subprocess.SubprocessError):
             pass
         
         # Check common installation paths on Windows
@@ -92,11 +131,7 @@ class FFmpegManager:
         if ffmpeg_path and os.path.exists(ffmpeg_path):
             # Verify it's actually ffmpeg
             try:
-                result = subprocess.run([ffmpeg_path, '-version'], 
-                                      capture_output=True, 
-                                      text=True, 
-                                      timeout=5)
-                if result.returncode == 0 and 'ffmpeg' in result.stdout.lower():
+                if FFmpegManager.verify_ffmpeg(ffmpeg_path):
                     return ffmpeg_path
                 else:
                     messagebox.showerror("Invalid FFmpeg", 
@@ -127,6 +162,9 @@ class FFmpegManager:
 class LocalWhisperBackend(TranscriptionBackend):
     """Local Whisper model transcription backend with ffmpeg handling."""
     
+    # A single Whisper model instance is not safe to run concurrently
+    parallel_chunks = 1
+    
     def __init__(self, model_name: str = None):
         """Initialize the local Whisper backend.
 
@@ -315,7 +353,6 @@ class LocalWhisperBackend(TranscriptionBackend):
                 logging.info(f"Chunk {i+1}/{len(chunk_files)} completed. Length: {len(chunk_text)} characters")
             
             # Combine transcriptions
-            from audio_processor import audio_processor
             combined_text = audio_processor.combine_transcriptions(transcriptions)
             
             logging.info(f"Local chunked transcription complete. Total length: {len(combined_text)} characters")
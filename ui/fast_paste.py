@@ -0,0 +1,142 @@
+"""
+Direct text input for the Audio Recorder application.
+Types text into the active window with Win32 SendInput unicode events,
+without touching the clipboard or simulating Ctrl+V.
+"""
+import ctypes
+import sys
+from ctypes import wintypes
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+# Characters per SendInput call
+BATCH_SIZE = 100
+
+
+class MOUSEINPUT(ctypes.Structure):
+    """Win32 MOUSEINPUT; only needed so the INPUT union has its full size."""
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    """Win32 KEYBDINPUT."""
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    """Win32 INPUT."""
+    _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+
+# Resolve SendInput once at import; None on platforms without user32
+_send_input = None
+if sys.platform == "win32":
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _send_input = _user32.SendInput
+    _send_input.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    _send_input.restype = wintypes.UINT
+
+
+def is_available() -> bool:
+    """Check if direct text input is supported on this platform.
+
+    Returns:
+        True if SendInput is available.
+    """
+    return _send_input is not None
+
+
+def _build_inputs(chars: str) -> ctypes.Array:
+    """Build key down/up unicode events for a run of characters.
+
+    Args:
+        chars: Characters to type.
+
+    Returns:
+        ctypes array of INPUT structures.
+    """
+    # SendInput works in UTF-16 code units; characters outside the BMP
+    # become surrogate pairs
+    data = chars.replace("\n", "\r").encode("utf-16-le")
+    units = [int.from_bytes(data[i:i + 2], "little") for i in range(0, len(data), 2)]
+
+    inputs = (INPUT * (len(units) * 2))()
+    for i, unit in enumerate(units):
+        for j, flags in enumerate((KEYEVENTF_UNICODE, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP)):
+            event = inputs[i * 2 + j]
+            event.type = INPUT_KEYBOARD
+            event.union.ki.wScan = unit
+            event.union.ki.dwFlags = flags
+    return inputs
+
+
+def _chars_for_units(chars: str, units: int) -> int:
+    """Count how many whole characters fit in a number of UTF-16 code units.
+
+    Args:
+        chars: Characters that were being typed.
+        units: Number of UTF-16 code units that were typed.
+
+    Returns:
+        Number of leading characters fully typed.
+    """
+    count = 0
+    for char in chars:
+        # Characters outside the BMP take a surrogate pair
+        width = 2 if ord(char) > 0xFFFF else 1
+        if width > units:
+            break
+        units -= width
+        count += 1
+    return count
+
+
+def type_unicode(text: str) -> int:
+    """Type text into the active window.
+
+    Stops at the first batch the system rejects (e.g. when the target
+    window runs elevated), so the caller can deliver the rest another way.
+
+    Args:
+        text: Text to type.
+
+    Returns:
+        Number of characters of text that were typed.
+
+    Raises:
+        OSError: If SendInput is not available on this platform.
+    """
+    if _send_input is None:
+        raise OSError("SendInput is not available on this platform")
+
+    typed = 0
+    for start in range(0, len(text), BATCH_SIZE):
+        batch = text[start:start + BATCH_SIZE]
+        inputs = _build_inputs(batch)
+        sent = _send_input(len(inputs), inputs, ctypes.sizeof(INPUT))
+        if sent != len(inputs):
+            # Part of the batch may have gone through; each code unit is a
+            # key down/up pair
+            typed += _chars_for_units(batch, sent // 2)
+            break
+        typed += len(batch)
+    return typed
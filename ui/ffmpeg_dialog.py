@@ -2,9 +2,11 @@
 FFmpeg configuration dialog.
 """
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import os
+import platform
 from settings import settings_manager
+from transcriber.local_backend import FFmpegManager
 
 
 class FFmpegConfigDialog:
@@ -56,7 +58,6 @@ class FFmpegConfigDialog:
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 10))
 
         # Check current FFmpeg status
-        from transcriber.local_backend import FFmpegManager
         detected_ffmpeg = FFmpegManager.detect_ffmpeg()
         settings = settings_manager.load_all_settings()
         saved_path = settings.get('ffmpeg_path', '')
@@ -117,9 +118,6 @@ Common FFmpeg locations on Windows:
     
     def _browse_ffmpeg(self):
         """Browse for FFmpeg executable."""
-        from tkinter import filedialog
-        import platform
-
         # Open file dialog to select ffmpeg.exe
         if platform.system() == "Windows":
             file_types = [("Executable files", "*.exe"), ("All files", "*.*")]
@@ -137,11 +135,8 @@ Common FFmpeg locations on Windows:
 
         if ffmpeg_path:
             # Verify it's actually ffmpeg
-            import subprocess
             try:
-                result = subprocess.run([ffmpeg_path, '-version'],
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0 and 'ffmpeg version' in result.stdout.lower():
+                if FFmpegManager.verify_ffmpeg(ffmpeg_path):
                     # Save the path
                     settings = settings_manager.load_all_settings()
                     settings['ffmpeg_path'] = ffmpeg_path
@@ -170,11 +165,8 @@ Common FFmpeg locations on Windows:
             return
         
         # Test the executable
-        import subprocess
         try:
-            result = subprocess.run([ffmpeg_path, '-version'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
+            if FFmpegManager.verify_ffmpeg(ffmpeg_path):
                 messagebox.showinfo("Success", "FFmpeg is working correctly!")
             else:
                 messagebox.showerror("Error", "FFmpeg test failed.")
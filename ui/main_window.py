@@ -3,12 +3,12 @@ Main window UI component for the Audio Recorder application.
 """
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
+import sys
 import threading
 import logging
-import pyperclip
-import keyboard
-from typing import Optional, Callable, Dict
-from concurrent.futures import ThreadPoolExecutor
+import collections
+from typing import Optional, Callable, Dict, List, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed, wait
 import os
 
 from config import config
@@ -17,14 +17,76 @@ from transcriber import TranscriptionBackend, LocalWhisperBackend
 from hotkey_manager import HotkeyManager
 from settings import settings_manager
 from audio_processor import audio_processor
+from worker_pool import WorkerPoolContext
 from .tray import TrayManager
+from . import fast_paste
 from .waveform_overlay import WaveformOverlay
-from .waveform_style_dialog import WaveformStyleDialog
+
+
+# Supported file types for the open audio file dialog
+_AUDIO_FILETYPES = (
+    ('Audio Files', '*.wav *.mp3 *.m4a *.flac *.ogg *.aac *.wma'),
+    ('WAV files', '*.wav'),
+    ('MP3 files', '*.mp3'),
+    ('M4A files', '*.m4a'),
+    ('FLAC files', '*.flac'),
+    ('OGG files', '*.ogg'),
+    ('All files', '*.*')
+)
+
+# Start, stop, cancel and open file button states for each UI mode
+_UI_MODE_BUTTON_STATES = {
+    "idle": (tk.NORMAL, tk.DISABLED, tk.DISABLED, tk.NORMAL),
+    "recording": (tk.DISABLED, tk.NORMAL, tk.NORMAL, tk.DISABLED),
+    "transcribing": (tk.DISABLED, tk.DISABLED, tk.NORMAL, tk.DISABLED),
+}
+
+# Starting directory for the open audio file dialog
+_HOME_DIR = os.path.expanduser('~')
+
+
+def _install_styles(style: ttk.Style):
+    """Apply the custom button styles to the clam theme in one Tcl call.
+    
+    Args:
+        style: Style object of the window's Tk interpreter.
+    """
+    def button(background, active, font, padding):
+        return {
+            'configure': {
+                'background': background,
+                'foreground': 'white',
+                'borderwidth': 0,
+                'focuscolor': 'none',
+                'font': font,
+                'padding': padding,
+            },
+            'map': {'background': [('active', active)]},
+        }
+    
+    style.theme_settings('clam', {
+        # Start button style (accent color) - Enhanced modern look
+        'Start.TButton': button(config.WAVEFORM_ACCENT_COLOR, config.WAVEFORM_SECONDARY_COLOR,
+                                ('Segoe UI', 11, 'bold'), (12, 10)),
+        # Stop button style (warning color) - Enhanced modern look
+        'Stop.TButton': button('#ff6b6b', '#ff5252', ('Segoe UI', 11, 'bold'), (12, 10)),
+        # Cancel button style - Modern sizing
+        'Cancel.TButton': button('#444444', '#555555', ('Segoe UI', 10), (10, 8)),
+        # File button style - Enhanced modern look
+        'File.TButton': button(config.WAVEFORM_SECONDARY_COLOR, '#007aa3', ('Segoe UI', 11), (12, 10)),
+    })
 
 
 class UIStatusController:
     """Manages UI status updates and overlay display."""
     
+    # Status keyword to overlay state, checked in order
+    _STATE_TABLE = (
+        ("Recording", "recording"),
+        ("Processing", "processing"),
+        ("Transcribing", "transcribing"),
+    )
+    
     def __init__(self, main_window):
         """Initialize the status controller.
         
@@ -32,9 +94,12 @@ class UIStatusController:
             main_window: Reference to the main window instance.
         """
         self.main_window = main_window
+        # Last (status, show_overlay) applied, to skip identical repeats
+        self._last_status = (None, None)
+        # Pending auto-clear timer
+        self._clear_id = None
         # Initialize overlay with saved style if available
         try:
-            from settings import settings_manager
             current_style, all_configs = settings_manager.load_waveform_style_settings()
             self.waveform_overlay = WaveformOverlay(main_window.root, initial_style=current_style)
             # Apply config explicitly in case style has non-defaults
@@ -44,13 +109,25 @@ class UIStatusController:
             # Fallback to default overlay
             self.waveform_overlay = WaveformOverlay(main_window.root)
     
-    def update_status(self, status: str, show_overlay: bool = True):
+    def update_status(self, status: str, show_overlay: bool = True, state: Optional[str] = None):
         """Update status in both main window and overlay.
         
         Args:
             status: Status message to display.
             show_overlay: Whether to show the overlay.
+            state: Overlay state for the message. Derived from the message text if None.
         """
+        # Skip repeats while the overlay still shows what the last call set up
+        key = (status, show_overlay)
+        overlay = self.waveform_overlay
+        if show_overlay:
+            unchanged = overlay.is_visible and overlay.current_message == status
+        else:
+            unchanged = not overlay.is_visible
+        if key == self._last_status and unchanged:
+            return
+        self._last_status = key
+        
         # Update main window status
         if self.main_window.status_label:
             self.main_window.status_label.config(text=f"Status: {status}")
@@ -58,12 +135,10 @@ class UIStatusController:
         # Update waveform overlay if requested
         if show_overlay:
             # Map status messages to overlay states
-            if "Recording" in status:
-                self.waveform_overlay.show("recording", status)
-            elif "Processing" in status:
-                self.waveform_overlay.show("processing", status)
-            elif "Transcribing" in status:
-                self.waveform_overlay.show("transcribing", status)
+            if state is None:
+                state = next((s for keyword, s in self._STATE_TABLE if keyword in status), None)
+            if state:
+                self.waveform_overlay.show(state, status)
             else:
                 # For other statuses, hide the overlay
                 self.waveform_overlay.hide()
@@ -73,6 +148,7 @@ class UIStatusController:
     
     def clear_status(self):
         """Clear the status overlay."""
+        self._last_status = (None, None)
         self.waveform_overlay.hide()
     
     def update_status_with_auto_clear(self, status: str, delay_ms: int = None):
@@ -82,7 +158,6 @@ class UIStatusController:
             status: Status message to display.
             delay_ms: Delay in milliseconds before clearing. Uses config default if None.
         """
-        from config import config
         delay = delay_ms or config.OVERLAY_HIDE_DELAY_MS
         
         # Special handling for STT enable/disable messages
@@ -94,8 +169,16 @@ class UIStatusController:
             # Update status and show overlay for other messages
             self.update_status(status, show_overlay=True)
         
-        # Schedule clearing after delay
-        self.main_window.root.after(delay, self.clear_status)
+        # Schedule clearing after delay, replacing any pending clear
+        root = self.main_window.root
+        if self._clear_id is not None:
+            root.after_cancel(self._clear_id)
+        self._clear_id = root.after(delay, self._auto_clear)
+    
+    def _auto_clear(self):
+        """Clear the status when the auto-clear timer fires."""
+        self._clear_id = None
+        self.clear_status()
     
     def _show_stt_status(self, message: str, state: str):
         """Show STT status with specialized overlay state.
@@ -104,6 +187,8 @@ class UIStatusController:
             message: Status message to display.
             state: STT state ('enabled' or 'disabled').
         """
+        self._last_status = (None, None)
+
         # Update main window status
         if self.main_window.status_label:
             self.main_window.status_label.config(text=f"Status: {message}")
@@ -147,7 +232,27 @@ class MainWindow:
         self.current_backend: Optional[TranscriptionBackend] = None
         self.hotkey_manager: Optional[HotkeyManager] = None
         self.tray_manager = TrayManager()
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        # Transcription is serial, so one worker is enough
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcribe")
+        self._current_future: Optional[Future] = None
+        # Chunk futures of the running job, and per-job flags that stop them on
+        # cancel: one for the latest submitted job, one for the job on the worker
+        self._active_futures: List[Future] = []
+        self._cancel_event = threading.Event()
+        self._worker_cancel_event = threading.Event()
+        # Thread pool for chunk transcription, kept alive between bursts of work
+        self._chunk_pools = WorkerPoolContext()
+        # Bumped per submitted job and on cancel; results from older jobs are dropped
+        self._job_id = 0
+        self._worker_job_id = 0
+        # Latest audio level from the recorder thread; drained on the Tk thread
+        self._level_q = collections.deque(maxlen=1)
+        # (done, written, total) chunks, total None while still splitting; written
+        # by the transcription worker and polled on the Tk thread
+        self._chunk_progress: Optional[Tuple[int, int, Optional[int]]] = None
+        self._chunk_progress_shown: Optional[Tuple[int, int, Optional[int]]] = None
+        self._chunk_status_prefix = ""
+        self._chunk_poll_active = False
         
         # UI components
         self.status_label: Optional[tk.Label] = None
@@ -156,6 +261,9 @@ class MainWindow:
         self.stop_button: Optional[ttk.Button] = None
         self.cancel_button: Optional[ttk.Button] = None
         self.open_file_button: Optional[ttk.Button] = None
+        self._main_frame: Optional[tk.Frame] = None
+        # Matches the button states set up in _setup_gui_critical
+        self._ui_mode = "idle"
         
         # Status management
         self.status_controller = UIStatusController(self)
@@ -171,12 +279,10 @@ class MainWindow:
         self.overlay_label = tk.Label(self.overlay, text="", bg='black', fg='white', pady=5)
         self.overlay_label.pack(fill=tk.BOTH, expand=True)
         
-        # Setup components
+        # Setup components; only what the first paint needs runs here
         self._setup_transcription_backends()
-        self._setup_gui()
-        self._setup_hotkeys()
-        self._setup_tray()
-        self._setup_audio_level_callback()
+        self._setup_gui_critical()
+        self.root.after_idle(self._finish_setup)
         
         # Handle window close event
         self.root.protocol('WM_DELETE_WINDOW', self.on_closing)
@@ -186,11 +292,26 @@ class MainWindow:
     def _setup_transcription_backends(self):
         """Initialize transcription backend (local whisper only)."""
         # Always use Local Whisper backend
-        self.transcription_backends['local_whisper'] = LocalWhisperBackend()
-        self.current_backend = self.transcription_backends['local_whisper']
+        backend = LocalWhisperBackend()
+        self.transcription_backends['local_whisper'] = backend
+        self.current_backend = backend
     
-    def _setup_gui(self):
-        """Create and configure the main GUI interface."""
+    def _finish_setup(self):
+        """Build the rest of the window and start hotkeys, tray and level updates."""
+        self._setup_gui_secondary()
+        self._setup_hotkeys()
+        self._setup_tray()
+        self._setup_audio_level_callback()
+        logging.info("Main window setup finished")
+    
+    def _setup_gui_critical(self):
+        """Create the menu, header, status and action buttons."""
+        # Theme colors
+        bg = config.WAVEFORM_BG_COLOR
+        accent = config.WAVEFORM_ACCENT_COLOR
+        secondary = config.WAVEFORM_SECONDARY_COLOR
+        text_color = config.WAVEFORM_TEXT_COLOR
+
         # Create menu bar
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
@@ -212,11 +333,12 @@ class MainWindow:
         
 
         # Main frame with padding - use tk.Frame for custom background
-        main_frame = tk.Frame(self.root, bg=config.WAVEFORM_BG_COLOR, padx=20, pady=15)
+        main_frame = tk.Frame(self.root, bg=bg, padx=20, pady=15)
         main_frame.pack(fill=tk.BOTH, expand=True)
+        self._main_frame = main_frame
 
         # Header with B.L.A.D.E. branding - Modern elevated design
-        header_frame = tk.Frame(main_frame, bg=config.WAVEFORM_BG_COLOR)
+        header_frame = tk.Frame(main_frame, bg=bg)
         header_frame.pack(fill=tk.X, pady=(5, 20))
 
         # Main title with dramatic size
@@ -224,8 +346,8 @@ class MainWindow:
             header_frame,
             text="B.L.A.D.E.",
             font=("Segoe UI", 42, "bold"),
-            bg=config.WAVEFORM_BG_COLOR,
-            fg=config.WAVEFORM_ACCENT_COLOR,
+            bg=bg,
+            fg=accent,
             pady=8
         )
         title_label.pack()
@@ -235,26 +357,26 @@ class MainWindow:
             header_frame,
             text="Brister's Linguistic Audio Dictation Engine",
             font=("Segoe UI", 13, "normal"),
-            bg=config.WAVEFORM_BG_COLOR,
+            bg=bg,
             fg="#b0b0b0",
             pady=5
         )
         subtitle_label.pack()
 
         # Modern gradient-style separator (dual line effect)
-        separator_container = tk.Frame(main_frame, bg=config.WAVEFORM_BG_COLOR)
+        separator_container = tk.Frame(main_frame, bg=bg)
         separator_container.pack(fill=tk.X, pady=(0, 18))
 
-        separator_top = tk.Frame(separator_container, height=1, bg=config.WAVEFORM_ACCENT_COLOR)
+        separator_top = tk.Frame(separator_container, height=1, bg=accent)
         separator_top.pack(fill=tk.X)
 
-        tk.Frame(separator_container, height=2, bg=config.WAVEFORM_BG_COLOR).pack()
+        tk.Frame(separator_container, height=2, bg=bg).pack()
 
-        separator_bottom = tk.Frame(separator_container, height=1, bg=config.WAVEFORM_SECONDARY_COLOR)
+        separator_bottom = tk.Frame(separator_container, height=1, bg=secondary)
         separator_bottom.pack(fill=tk.X)
 
         # Status label with elevated modern styling and subtle border
-        status_outer = tk.Frame(main_frame, bg=config.WAVEFORM_SECONDARY_COLOR, bd=0)
+        status_outer = tk.Frame(main_frame, bg=secondary, bd=0)
         status_outer.pack(fill=tk.X, pady=(0, 18))
 
         status_frame = tk.Frame(status_outer, bg="#2a2a2a", bd=0)
@@ -265,63 +387,20 @@ class MainWindow:
             text="Status: Ready",
             font=("Segoe UI", 11),
             bg="#2a2a2a",
-            fg=config.WAVEFORM_TEXT_COLOR,
+            fg=text_color,
             pady=10,
             padx=12
         )
         self.status_label.pack(fill=tk.X)
 
         # Recording buttons frame
-        recording_frame = tk.Frame(main_frame, bg=config.WAVEFORM_BG_COLOR)
+        recording_frame = tk.Frame(main_frame, bg=bg)
         recording_frame.pack(pady=(0, 10), fill=tk.X)
 
         # Configure custom button style
         style = ttk.Style()
         style.theme_use('clam')
-
-        # Start button style (accent color) - Enhanced modern look
-        style.configure('Start.TButton',
-                       background=config.WAVEFORM_ACCENT_COLOR,
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       font=('Segoe UI', 11, 'bold'),
-                       padding=(12, 10))
-        style.map('Start.TButton',
-                 background=[('active', config.WAVEFORM_SECONDARY_COLOR)])
-
-        # Stop button style (warning color) - Enhanced modern look
-        style.configure('Stop.TButton',
-                       background='#ff6b6b',
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       font=('Segoe UI', 11, 'bold'),
-                       padding=(12, 10))
-        style.map('Stop.TButton',
-                 background=[('active', '#ff5252')])
-
-        # Cancel button style - Modern sizing
-        style.configure('Cancel.TButton',
-                       background='#444444',
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       font=('Segoe UI', 10),
-                       padding=(10, 8))
-        style.map('Cancel.TButton',
-                 background=[('active', '#555555')])
-
-        # File button style - Enhanced modern look
-        style.configure('File.TButton',
-                       background=config.WAVEFORM_SECONDARY_COLOR,
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       font=('Segoe UI', 11),
-                       padding=(12, 10))
-        style.map('File.TButton',
-                 background=[('active', '#007aa3')])
+        _install_styles(style)
 
         self.start_button = ttk.Button(
             recording_frame,
@@ -359,19 +438,28 @@ class MainWindow:
         )
         self.cancel_button.pack(pady=(0, 15), fill=tk.X)
 
+    def _setup_gui_secondary(self):
+        """Create the transcription display below the buttons."""
+        # Theme colors
+        bg = config.WAVEFORM_BG_COLOR
+        accent = config.WAVEFORM_ACCENT_COLOR
+        secondary = config.WAVEFORM_SECONDARY_COLOR
+        text_color = config.WAVEFORM_TEXT_COLOR
+        main_frame = self._main_frame
+
         # Transcription display section with modern styling
         transcription_label = tk.Label(
             main_frame,
             text="Transcription",
             font=("Segoe UI", 11, "bold"),
-            bg=config.WAVEFORM_BG_COLOR,
-            fg=config.WAVEFORM_ACCENT_COLOR,
+            bg=bg,
+            fg=accent,
             anchor='w'
         )
         transcription_label.pack(fill=tk.X, pady=(0, 8))
 
         # Scrollable text frame with subtle border
-        text_outer = tk.Frame(main_frame, bg=config.WAVEFORM_SECONDARY_COLOR, bd=0)
+        text_outer = tk.Frame(main_frame, bg=secondary, bd=0)
         text_outer.pack(fill=tk.BOTH, expand=True)
 
         text_frame = tk.Frame(text_outer, bg="#2a2a2a", bd=0)
@@ -388,8 +476,8 @@ class MainWindow:
             relief=tk.FLAT,
             font=('Segoe UI', 10),
             bg="#2a2a2a",
-            fg=config.WAVEFORM_TEXT_COLOR,
-            insertbackground=config.WAVEFORM_ACCENT_COLOR,
+            fg=text_color,
+            insertbackground=accent,
             padx=12,
             pady=12,
             yscrollcommand=scrollbar.set
@@ -420,13 +508,20 @@ class MainWindow:
     
     def _setup_audio_level_callback(self):
         """Setup audio level callback for waveform overlay."""
-        def audio_level_callback(level: float):
-            # Update waveform overlay with audio level
+        # Runs on the recorder thread, so only hand the level over; no Tk calls
+        self.recorder.set_audio_level_callback(self._level_q.append)
+        self.root.after(config.AUDIO_LEVEL_PUMP_MS, self._pump_audio_level)
+    
+    def _pump_audio_level(self):
+        """Apply the most recent audio level to the overlay once per frame."""
+        try:
+            level = self._level_q.pop()
+        except IndexError:
+            pass
+        else:
             if self.status_controller.waveform_overlay:
                 self.status_controller.waveform_overlay.update_audio_level(level)
-        
-        # Set the callback on the audio recorder
-        self.recorder.set_audio_level_callback(audio_level_callback)
+        self.root.after(config.AUDIO_LEVEL_PUMP_MS, self._pump_audio_level)
     
     def show_window(self):
         """Show the main window."""
@@ -447,20 +542,18 @@ class MainWindow:
     def start_recording(self):
         """Start audio recording."""
         if self.recorder.start_recording():
-            self.start_button.config(state=tk.DISABLED)
-            self.stop_button.config(state=tk.NORMAL)
-            self.cancel_button.config(state=tk.NORMAL)
-            self.open_file_button.config(state=tk.DISABLED)
-            self.status_controller.update_status("Recording...")
+            self._set_ui_mode("recording")
+            self.status_controller.update_status("Recording...", state="recording")
             logging.info("Recording started from GUI")
     
     def stop_recording(self):
         """Stop audio recording and start transcription."""
         # Update UI immediately for instant response
-        self.start_button.config(state=tk.DISABLED)
-        self.stop_button.config(state=tk.DISABLED)
+        self._set_ui_mode("transcribing")
         # Show transcribing status immediately for better UX
-        self.status_controller.update_status("Transcribing...")
+        self.status_controller.update_status("Transcribing...", state="transcribing")
+        # Paint the new state once before saving the recording blocks the loop
+        self.root.update_idletasks()
         
         if self.recorder.stop_recording():
             # Check if we have actual recording data
@@ -476,13 +569,14 @@ class MainWindow:
                 return
             
             # Verify the audio file exists and has content
-            import os
-            if not os.path.exists(config.RECORDED_AUDIO_FILE):
+            try:
+                audio_stat = os.stat(config.RECORDED_AUDIO_FILE)
+            except FileNotFoundError:
                 logging.error(f"Audio file not found: {config.RECORDED_AUDIO_FILE}")
                 self._on_transcription_error("Audio file not created")
                 return
             
-            file_size = os.path.getsize(config.RECORDED_AUDIO_FILE)
+            file_size = audio_stat.st_size
             logging.info(f"Audio file size: {file_size} bytes")
             if file_size < 100:  # WAV header is about 44 bytes, so anything less than 100 is suspect
                 logging.error(f"Audio file too small: {file_size} bytes")
@@ -491,17 +585,18 @@ class MainWindow:
             
             # Check if file needs splitting due to size limit
             try:
-                needs_splitting, file_size_mb = audio_processor.check_file_size(config.RECORDED_AUDIO_FILE)
+                needs_splitting, file_size_mb = audio_processor.check_file_size(
+                    config.RECORDED_AUDIO_FILE, audio_stat)
                 
                 if needs_splitting:
                     logging.info(f"Large file detected ({file_size_mb:.2f} MB), starting split workflow")
                     # Update status to indicate large file processing
-                    self.status_controller.update_status(f"Processing large file ({file_size_mb:.1f} MB)...")
+                    self.status_controller.update_status(f"Processing large file ({file_size_mb:.1f} MB)...", state="processing")
                     # Start split and transcribe workflow
-                    future = self.executor.submit(self._transcribe_large_audio)
+                    self._submit_transcription(self._transcribe_large_audio)
                 else:
                     # Normal transcription workflow
-                    future = self.executor.submit(self._transcribe_audio)
+                    self._submit_transcription(self._transcribe_audio)
                     
                 logging.info(f"Recording stopped, transcription started. Audio duration: {self.recorder.get_recording_duration():.2f}s")
                 
@@ -526,90 +621,165 @@ class MainWindow:
             self.recorder.stop_recording()
             # Clear the recording data since it was cancelled
             self.recorder.clear_recording_data()
-            self.start_button.config(state=tk.NORMAL)
-            self.stop_button.config(state=tk.DISABLED)
-            self.open_file_button.config(state=tk.NORMAL)
+            self._set_ui_mode("idle")
             # Show cancelling animation
             self.status_controller.waveform_overlay.show_canceling("Recording Cancelled")
             logging.info("Recording cancelled and data cleared")
 
         elif self.current_backend and self.current_backend.is_transcribing:
             self.current_backend.cancel_transcription()
-            self.start_button.config(state=tk.NORMAL)
-            self.open_file_button.config(state=tk.NORMAL)
+            self._discard_current_job()
+            self._set_ui_mode("idle")
             # Show cancelling animation
             self.status_controller.waveform_overlay.show_canceling("Transcription Cancelled")
             logging.info("Transcription cancelled")
 
         else:
             # If neither recording nor transcribing, still show a brief cancellation message
+            self._discard_current_job()
             self.status_controller.waveform_overlay.show_canceling("Cancelled")
-            self.start_button.config(state=tk.NORMAL)
-            self.open_file_button.config(state=tk.NORMAL)
-
-        self.cancel_button.config(state=tk.DISABLED)
+            self._set_ui_mode("idle")
+    
+    def _set_ui_mode(self, mode: str):
+        """Switch the action buttons to the states for a UI mode.
+        
+        Does nothing if the buttons are already in that mode.
+        
+        Args:
+            mode: One of 'idle', 'recording' or 'transcribing'.
+        """
+        if mode == self._ui_mode:
+            return
+        self._ui_mode = mode
+        self._apply_button_state(*_UI_MODE_BUTTON_STATES[mode])
+    
+    def _apply_button_state(self, start: Optional[str] = None, stop: Optional[str] = None,
+                            cancel: Optional[str] = None, open_file: Optional[str] = None):
+        """Set the state of the action buttons in one pass.
+        
+        Args:
+            start: State for the start button, or None to leave it unchanged.
+            stop: State for the stop button, or None to leave it unchanged.
+            cancel: State for the cancel button, or None to leave it unchanged.
+            open_file: State for the open file button, or None to leave it unchanged.
+        """
+        buttons = (self.start_button, self.stop_button, self.cancel_button, self.open_file_button)
+        for button, state in zip(buttons, (start, stop, cancel, open_file)):
+            if state is not None:
+                button.config(state=state)
+    
+    def _submit_transcription(self, fn: Callable, *args):
+        """Queue a transcription job on the worker thread.
+        
+        Args:
+            fn: Job to run.
+            *args: Arguments for the job.
+        """
+        self._job_id += 1
+        # A fresh flag, so a cancelled job still winding down stays cancelled
+        self._cancel_event = threading.Event()
+        self._current_future = self.executor.submit(self._run_transcription, self._job_id,
+                                                    self._cancel_event, fn, *args)
+    
+    def _run_transcription(self, job_id: int, cancel_event: threading.Event, fn: Callable, *args):
+        """Run a queued job, remembering its id and cancel flag for the worker."""
+        self._worker_job_id = job_id
+        self._worker_cancel_event = cancel_event
+        self._active_futures = []
+        fn(*args)
+    
+    def _discard_current_job(self):
+        """Drop the pending or running job so its result is never shown."""
+        # Release the chunk workers too: queued chunks are cancelled and
+        # chunks that haven't reached the backend yet are skipped. Flag both the
+        # latest job and the one on the worker, which may be an older one
+        self._cancel_event.set()
+        self._worker_cancel_event.set()
+        for future in list(self._active_futures):
+            future.cancel()
+        if self._current_future:
+            self._current_future.cancel()
+        self._job_id += 1
+    
+    def _post_result(self, callback: Callable, *args):
+        """Deliver a job result on the Tk thread unless the job was discarded.
+        
+        Args:
+            callback: Result handler to run on the main thread.
+            *args: Arguments for the handler.
+        """
+        self.root.after_idle(self._deliver_result, self._worker_job_id, callback, *args)
+    
+    def _deliver_result(self, job_id: int, callback: Callable, *args):
+        """Run a result handler if its job is still the current one."""
+        if job_id != self._job_id:
+            logging.info(f"Dropping result of discarded transcription job {job_id}")
+            return
+        callback(*args)
+    
+    def _post_status(self, status: str):
+        """Update status from a worker thread via the Tk event loop.
+        
+        Args:
+            status: Status message to display.
+        """
+        self.root.after_idle(self.status_controller.update_status, status)
     
     def _transcribe_audio(self):
         """Transcribe audio in background thread."""
         try:
-            self.status_controller.update_status("Transcribing...")
+            self._post_status("Transcribing...")
             
             # Transcribe using current backend
             transcribed_text = self.current_backend.transcribe(config.RECORDED_AUDIO_FILE)
             
             # Update UI on main thread
-            self.root.after(0, self._on_transcription_complete, transcribed_text)
+            self._post_result(self._on_transcription_complete, transcribed_text)
             
         except Exception as e:
             logging.error(f"Transcription failed: {e}")
-            self.root.after(0, self._on_transcription_error, str(e))
+            self._post_result(self._on_transcription_error, str(e))
     
     def _transcribe_large_audio(self):
         """Transcribe large audio file by splitting it into chunks."""
         chunk_files = []
         try:
             # Add status update immediately when large audio processing starts
-            self.root.after(0, lambda: self.status_controller.update_status("Processing large audio file..."))
+            self._post_status("Processing large audio file...")
+            
+            # Backends that spread one file across processors need no splitting
+            transcribe_parallel = getattr(self.current_backend, 'transcribe_parallel', None)
+            if transcribe_parallel:
+                self._post_status("Transcribing large audio file...")
+                transcribed_text = transcribe_parallel(config.RECORDED_AUDIO_FILE, n_processors=self._parallel_processors())
+                self._post_result(self._on_transcription_complete, transcribed_text)
+                return
             
-            # Step 1: Split the audio file
             def progress_callback(message):
                 """Update status with splitting progress."""
-                self.root.after(0, lambda: self.status_controller.update_status(message))
-            
-            chunk_files = audio_processor.split_audio_file(config.RECORDED_AUDIO_FILE, progress_callback)
+                self._post_status(message)
             
-            if not chunk_files:
-                raise Exception("Failed to split audio file into chunks")
-            
-            # Step 2: Check if backend supports chunked transcription
-            if hasattr(self.current_backend, 'transcribe_chunks'):
-                # Use backend's chunked transcription if available
-                self.root.after(0, lambda: self.status_controller.update_status(f"Transcribing {len(chunk_files)} chunks..."))
+            if self._backend_has_own_chunking():
+                # Step 1: Split the audio file
+                chunk_files = audio_processor.split_audio_file(config.RECORDED_AUDIO_FILE, progress_callback)
+                
+                if not chunk_files:
+                    raise Exception("Failed to split audio file into chunks")
+                
+                # Step 2: Use the backend's own chunked transcription
+                self._post_status(f"Transcribing {len(chunk_files)} chunks...")
                 transcribed_text = self.current_backend.transcribe_chunks(chunk_files)
             else:
-                # Fallback: transcribe chunks individually and combine
-                transcriptions = []
-                for i, chunk_file in enumerate(chunk_files):
-                    # Create a proper closure for the lambda
-                    current_chunk = i + 1
-                    total_chunks = len(chunk_files)
-                    self.root.after(0, lambda: self.status_controller.update_status(f"Transcribing chunk {current_chunk}/{total_chunks}..."))
-                    
-                    chunk_transcription = self.current_backend.transcribe(chunk_file)
-                    transcriptions.append(chunk_transcription)
-                    
-                    logging.info(f"Completed chunk {current_chunk}/{total_chunks}")
-                
-                # Combine transcriptions
-                self.root.after(0, lambda: self.status_controller.update_status("Combining transcriptions..."))
-                transcribed_text = audio_processor.combine_transcriptions(transcriptions)
+                # Split and transcribe together, combining chunks in order as they finish
+                transcribed_text = audio_processor.combine_transcriptions(
+                    self._iter_chunk_transcriptions(config.RECORDED_AUDIO_FILE, progress_callback))
             
             # Update UI on main thread
-            self.root.after(0, self._on_transcription_complete, transcribed_text)
+            self._post_result(self._on_transcription_complete, transcribed_text)
             
         except Exception as e:
             logging.error(f"Large audio transcription failed: {e}")
-            self.root.after(0, self._on_transcription_error, str(e))
+            self._post_result(self._on_transcription_error, str(e))
         finally:
             # Cleanup temporary chunk files
             try:
@@ -617,23 +787,158 @@ class MainWindow:
             except Exception as cleanup_error:
                 logging.warning(f"Failed to cleanup temp files: {cleanup_error}")
     
+    @staticmethod
+    def _parallel_processors() -> int:
+        """Number of processors to hand a backend's transcribe_parallel()."""
+        return max(1, (os.cpu_count() or 2) // 2)
+    
+    def _backend_has_own_chunking(self) -> bool:
+        """Check if the current backend overrides the default transcribe_chunks()."""
+        return type(self.current_backend).transcribe_chunks is not TranscriptionBackend.transcribe_chunks
+    
+    def _iter_chunk_transcriptions(self, audio_file: str,
+                                   progress_callback: Optional[Callable] = None) -> Iterator[str]:
+        """Split an audio file and transcribe its chunks concurrently, in order.
+        
+        Each chunk is submitted for transcription as soon as the splitter has
+        written it, so splitting overlaps with transcription. Concurrency is
+        capped by the backend's ``parallel_chunks``. Each transcription is
+        yielded as soon as it and every earlier chunk are done; later chunks
+        that finish early wait in a small buffer. Runs on the shared chunk
+        thread pool, since the transcription worker is busy running the
+        caller.
+        
+        Args:
+            audio_file: Path to the audio file to split.
+            progress_callback: Optional callback for splitting progress messages.
+            
+        Yields:
+            Transcription of each chunk, in playback order.
+            
+        Raises:
+            Exception: If splitting or transcribing a chunk fails.
+        """
+        backend = self.current_backend
+        cancel_event = self._worker_cancel_event
+        active_futures = self._active_futures
+        futures: Dict[Future, int] = {}
+        pending: Dict[int, str] = {}  # Finished chunks waiting for an earlier one
+        next_index = 0
+        
+        max_workers = min(getattr(backend, 'parallel_chunks', 1), os.cpu_count() or 1)
+        
+        with self._chunk_pools.pool(max_workers) as executor:
+            def on_chunk_ready(chunk_file: str, index: int):
+                """Start transcribing a chunk as soon as it is written."""
+                if cancel_event.is_set():
+                    # Stops the splitter as well
+                    raise Exception("Transcription cancelled")
+                future = executor.submit(self._transcribe_chunk, backend, chunk_file, cancel_event)
+                # Free the chunk's disk space as soon as it is transcribed
+                future.add_done_callback(lambda _, path=chunk_file: audio_processor.remove_temp_file(path))
+                futures[future] = index
+                active_futures.append(future)
+                # The total isn't known until the splitter is done
+                done = sum(1 for f in futures if f.done())
+                self._chunk_progress = (done, len(futures), None)
+            
+            try:
+                # Chunks finish while later ones are still being split, so show progress from the start
+                self._chunk_progress = (0, 0, None)
+                self.root.after_idle(self._start_chunk_progress_poll)
+                
+                chunk_files = audio_processor.split_audio_file(audio_file, progress_callback, on_chunk_ready)
+                if not chunk_files:
+                    raise Exception("Failed to split audio file into chunks")
+                
+                total_chunks = len(chunk_files)
+                self._chunk_progress = (self._chunk_progress[0], total_chunks, total_chunks)
+                
+                for completed, future in enumerate(as_completed(futures), 1):
+                    if cancel_event.is_set():
+                        raise Exception("Transcription cancelled")
+                    pending[futures[future]] = future.result()
+                    logging.info(f"Completed chunk {completed}/{total_chunks}")
+                    self._chunk_progress = (completed, total_chunks, total_chunks)
+                    
+                    while next_index in pending:
+                        yield pending.pop(next_index)
+                        next_index += 1
+            except BaseException:
+                # Drop chunks that haven't started yet, and let running ones
+                # finish before the caller deletes their files
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                raise
+            finally:
+                self._chunk_progress = None
+                active_futures.clear()
+    
+    def _transcribe_chunk(self, backend: TranscriptionBackend, chunk_file: str,
+                          cancel_event: threading.Event) -> str:
+        """Transcribe one chunk unless the job was cancelled while it was queued.
+        
+        Args:
+            backend: Backend to transcribe with.
+            chunk_file: Path to the chunk file.
+            cancel_event: Cancel flag of the job the chunk belongs to.
+            
+        Returns:
+            Transcribed text of the chunk.
+            
+        Raises:
+            Exception: If the job was cancelled or transcription fails.
+        """
+        if cancel_event.is_set():
+            raise Exception("Transcription cancelled")
+        return backend.transcribe(chunk_file)
+    
+    def _start_chunk_progress_poll(self):
+        """Start polling chunk progress unless a poll is already running."""
+        if not self._chunk_poll_active:
+            self._chunk_poll_active = True
+            self._poll_chunk_progress()
+    
+    def _poll_chunk_progress(self):
+        """Show the latest chunk progress; stops once the chunks are done."""
+        progress = self._chunk_progress
+        if progress is None:
+            self._chunk_poll_active = False
+            self._chunk_progress_shown = None
+            return
+        
+        if progress != self._chunk_progress_shown:
+            done, written, total = progress
+            if total is None:
+                text = f"Transcribing chunks while splitting: {done} of {written} done..."
+            else:
+                # The prefix only changes with the chunk count; reuse it between polls
+                if self._chunk_progress_shown is None or self._chunk_progress_shown[2] != total:
+                    self._chunk_status_prefix = f"Transcribing {total} chunks: "
+                text = f"{self._chunk_status_prefix}{done} done..."
+            self._chunk_progress_shown = progress
+            # Leave the splitter's own messages up until the first chunk is written
+            if written:
+                self.status_controller.update_status(text, state="transcribing")
+        self.root.after(config.CHUNK_PROGRESS_POLL_MS, self._poll_chunk_progress)
+    
     def _on_transcription_complete(self, transcribed_text: str):
         """Handle transcription completion on main thread."""
         # Update transcription display
-        self.transcription_text.config(state=tk.NORMAL)
-        self.transcription_text.delete(1.0, tk.END)
-        self.transcription_text.insert(tk.END, f"Transcription: {transcribed_text}")
-        self.transcription_text.config(state=tk.DISABLED)
+        if self.transcription_text:
+            self.transcription_text.config(state=tk.NORMAL)
+            self.transcription_text.delete(1.0, tk.END)
+            self.transcription_text.insert(tk.END, f"Transcription: {transcribed_text}")
+            self.transcription_text.config(state=tk.DISABLED)
 
         # Auto-paste the transcription
         self._paste_text(transcribed_text)
 
         # Clear the overlay and update status
         self.status_controller.clear_status()
+        self._set_ui_mode("idle")
         self.status_controller.update_status("Ready (Pasted)", show_overlay=False)
-        self.cancel_button.config(state=tk.DISABLED)
-        self.start_button.config(state=tk.NORMAL)
-        self.open_file_button.config(state=tk.NORMAL)
 
         logging.info("Transcription completed and pasted")
     
@@ -643,13 +948,24 @@ class MainWindow:
         self.status_controller.clear_status()
 
         messagebox.showerror("Error", f"Transcription failed: {error_message}")
+        self._set_ui_mode("idle")
         self.status_controller.update_status("Ready", show_overlay=False)
-        self.cancel_button.config(state=tk.DISABLED)
-        self.start_button.config(state=tk.NORMAL)
-        self.open_file_button.config(state=tk.NORMAL)
     
     def _paste_text(self, text: str):
         """Paste text at current cursor position."""
+        # Type directly where supported; no clipboard round-trip or Ctrl+V
+        if fast_paste.is_available():
+            try:
+                typed = fast_paste.type_unicode(text)
+            except OSError as e:
+                logging.warning(f"Direct text input failed, using clipboard paste: {e}")
+                typed = 0
+            if typed == len(text):
+                return
+            text = text[typed:]
+        
+        import pyperclip
+        import keyboard
         pyperclip.copy(text)
         keyboard.send('ctrl+v')
 
@@ -675,6 +991,7 @@ class MainWindow:
     def open_waveform_style_settings(self):
         """Open waveform style configuration dialog."""
         try:
+            from .waveform_style_dialog import WaveformStyleDialog
             # Load current style via SettingsManager
             current_style, all_configs = settings_manager.load_waveform_style_settings()
             current_config = all_configs.get(current_style, {})
@@ -690,6 +1007,7 @@ class MainWindow:
                     pass
 
             # After dialog closes, reload settings and apply to overlay immediately
+            settings_manager.invalidate_cache()
             new_style, new_configs = settings_manager.load_waveform_style_settings()
             new_config = new_configs.get(new_style, {})
             if self.status_controller.waveform_overlay:
@@ -723,35 +1041,25 @@ class MainWindow:
 
     def open_audio_file(self):
         """Open an existing audio file for transcription."""
-        # Define supported file types
-        filetypes = (
-            ('Audio Files', '*.wav *.mp3 *.m4a *.flac *.ogg *.aac *.wma'),
-            ('WAV files', '*.wav'),
-            ('MP3 files', '*.mp3'),
-            ('M4A files', '*.m4a'),
-            ('FLAC files', '*.flac'),
-            ('OGG files', '*.ogg'),
-            ('All files', '*.*')
-        )
-
         # Open file dialog
         filename = filedialog.askopenfilename(
             title='Open Audio File',
-            initialdir=os.path.expanduser('~'),
-            filetypes=filetypes
+            initialdir=_HOME_DIR,
+            filetypes=_AUDIO_FILETYPES
         )
 
         if not filename:
             # User cancelled
             return
 
-        # Verify file exists
-        if not os.path.exists(filename):
+        # Verify file exists and check its size
+        try:
+            file_stat = os.stat(filename)
+        except FileNotFoundError:
             messagebox.showerror("Error", f"File not found: {filename}")
             return
 
-        # Check file size
-        file_size = os.path.getsize(filename)
+        file_size = file_stat.st_size
         if file_size < 100:
             messagebox.showerror("Error", "Audio file is too small or empty")
             return
@@ -759,92 +1067,82 @@ class MainWindow:
         logging.info(f"Opening audio file: {filename} ({file_size} bytes)")
 
         # Disable buttons during transcription
-        self.start_button.config(state=tk.DISABLED)
-        self.stop_button.config(state=tk.DISABLED)
-        self.open_file_button.config(state=tk.DISABLED)
-        self.cancel_button.config(state=tk.NORMAL)
+        self._set_ui_mode("transcribing")
 
         # Update status
-        self.status_controller.update_status("Processing audio file...")
+        self.status_controller.update_status("Processing audio file...", state="processing")
 
         # Start transcription in background
         try:
-            needs_splitting, file_size_mb = audio_processor.check_file_size(filename)
+            needs_splitting, file_size_mb = audio_processor.check_file_size(filename, file_stat)
 
             if needs_splitting:
                 logging.info(f"Large file detected ({file_size_mb:.2f} MB), starting split workflow")
-                self.status_controller.update_status(f"Processing large file ({file_size_mb:.1f} MB)...")
-                future = self.executor.submit(self._transcribe_large_audio_from_file, filename)
+                self.status_controller.update_status(f"Processing large file ({file_size_mb:.1f} MB)...", state="processing")
+                self._submit_transcription(self._transcribe_large_audio_from_file, filename)
             else:
                 # Normal transcription workflow
-                future = self.executor.submit(self._transcribe_audio_from_file, filename)
+                self._submit_transcription(self._transcribe_audio_from_file, filename)
 
         except Exception as e:
             logging.error(f"Failed to process audio file: {e}")
             self._on_transcription_error(f"Failed to process audio file: {e}")
-            self.open_file_button.config(state=tk.NORMAL)
 
     def _transcribe_audio_from_file(self, audio_file: str):
         """Transcribe audio from an existing file in background thread."""
         try:
-            self.status_controller.update_status("Transcribing...")
+            self._post_status("Transcribing...")
 
             # Transcribe using current backend
             transcribed_text = self.current_backend.transcribe(audio_file)
 
             # Update UI on main thread
-            self.root.after(0, self._on_transcription_complete, transcribed_text)
+            self._post_result(self._on_transcription_complete, transcribed_text)
 
         except Exception as e:
             logging.error(f"Transcription failed: {e}")
-            self.root.after(0, self._on_transcription_error, str(e))
+            self._post_result(self._on_transcription_error, str(e))
 
     def _transcribe_large_audio_from_file(self, audio_file: str):
         """Transcribe large audio file by splitting it into chunks."""
         chunk_files = []
         try:
             # Add status update immediately when large audio processing starts
-            self.root.after(0, lambda: self.status_controller.update_status("Processing large audio file..."))
+            self._post_status("Processing large audio file...")
+
+            # Backends that spread one file across processors need no splitting
+            transcribe_parallel = getattr(self.current_backend, 'transcribe_parallel', None)
+            if transcribe_parallel:
+                self._post_status("Transcribing large audio file...")
+                transcribed_text = transcribe_parallel(audio_file, n_processors=self._parallel_processors())
+                self._post_result(self._on_transcription_complete, transcribed_text)
+                return
 
-            # Step 1: Split the audio file
             def progress_callback(message):
                 """Update status with splitting progress."""
-                self.root.after(0, lambda: self.status_controller.update_status(message))
+                self._post_status(message)
 
-            chunk_files = audio_processor.split_audio_file(audio_file, progress_callback)
+            if self._backend_has_own_chunking():
+                # Step 1: Split the audio file
+                chunk_files = audio_processor.split_audio_file(audio_file, progress_callback)
 
-            if not chunk_files:
-                raise Exception("Failed to split audio file into chunks")
+                if not chunk_files:
+                    raise Exception("Failed to split audio file into chunks")
 
-            # Step 2: Check if backend supports chunked transcription
-            if hasattr(self.current_backend, 'transcribe_chunks'):
-                # Use backend's chunked transcription if available
-                self.root.after(0, lambda: self.status_controller.update_status(f"Transcribing {len(chunk_files)} chunks..."))
+                # Step 2: Use the backend's own chunked transcription
+                self._post_status(f"Transcribing {len(chunk_files)} chunks...")
                 transcribed_text = self.current_backend.transcribe_chunks(chunk_files)
             else:
-                # Fallback: transcribe chunks individually and combine
-                transcriptions = []
-                for i, chunk_file in enumerate(chunk_files):
-                    # Create a proper closure for the lambda
-                    current_chunk = i + 1
-                    total_chunks = len(chunk_files)
-                    self.root.after(0, lambda: self.status_controller.update_status(f"Transcribing chunk {current_chunk}/{total_chunks}..."))
-
-                    chunk_transcription = self.current_backend.transcribe(chunk_file)
-                    transcriptions.append(chunk_transcription)
-
-                    logging.info(f"Completed chunk {current_chunk}/{total_chunks}")
-
-                # Combine transcriptions
-                self.root.after(0, lambda: self.status_controller.update_status("Combining transcriptions..."))
-                transcribed_text = audio_processor.combine_transcriptions(transcriptions)
+                # Split and transcribe together, combining chunks in order as they finish
+                transcribed_text = audio_processor.combine_transcriptions(
+                    self._iter_chunk_transcriptions(audio_file, progress_callback))
 
             # Update UI on main thread
-            self.root.after(0, self._on_transcription_complete, transcribed_text)
+            self._post_result(self._on_transcription_complete, transcribed_text)
 
         except Exception as e:
             logging.error(f"Large audio transcription failed: {e}")
-            self.root.after(0, self._on_transcription_error, str(e))
+            self._post_result(self._on_transcription_error, str(e))
         finally:
             # Cleanup temporary chunk files
             try:
@@ -865,21 +1163,37 @@ class MainWindow:
             # Clear any remaining overlay
             self.status_controller.clear_status()
             
-            # Cleanup waveform overlay
-            if self.status_controller.waveform_overlay:
-                self.status_controller.waveform_overlay.cleanup()
+            # Stop a running transcription and drop queued ones
+            if self.current_backend:
+                self.current_backend.cancel_transcription()
+            # Cancels queued chunks on Pythons without shutdown(cancel_futures=)
+            self._discard_current_job()
             
-            if self.hotkey_manager:
-                self.hotkey_manager.cleanup()
+            if self.executor:
+                if sys.version_info >= (3, 9):
+                    self.executor.shutdown(wait=False, cancel_futures=True)
+                else:
+                    # cancel_futures is 3.9+; the only queued job is the current one
+                    if self._current_future:
+                        self._current_future.cancel()
+                    self.executor.shutdown(wait=False)
             
-            if self.tray_manager:
-                self.tray_manager.cleanup()
+            self._chunk_pools.shutdown()
             
-            if self.recorder:
-                self.recorder.cleanup()
+            # Cleanup waveform overlay (Tk widgets must be destroyed on this thread)
+            if self.status_controller.waveform_overlay:
+                self.status_controller.waveform_overlay.cleanup()
             
-            if self.executor:
-                self.executor.shutdown(wait=False)
+            # The rest are independent and may wait on their own threads, so
+            # run them side by side
+            components = [c for c in (self.hotkey_manager, self.tray_manager, self.recorder) if c]
+            if components:
+                with ThreadPoolExecutor(max_workers=len(components), thread_name_prefix="cleanup") as pool:
+                    futures = [pool.submit(component.cleanup) for component in components]
+                for component, future in zip(components, futures):
+                    error = future.exception()
+                    if error:
+                        logging.error(f"Failed to clean up {type(component).__name__}: {error}")
                 
             logging.info("Main window cleanup completed")
             
@@ -8,6 +8,7 @@ from tkinter import Canvas
 import numpy as np
 import threading
 import time
+import collections
 import math
 from typing import List, Optional, Tuple, Dict, Any
 import logging
@@ -40,9 +41,12 @@ class WaveformOverlay:
         self.canceling_start_time = 0.0
         
         # Audio data
-        self.audio_levels: List[float] = [0.0] * config.WAVEFORM_BAR_COUNT  # Rolling buffer of audio levels
+        self.audio_levels = collections.deque(
+            [0.0] * config.WAVEFORM_BAR_COUNT, maxlen=config.WAVEFORM_BAR_COUNT
+        )  # Rolling buffer of audio levels
         self.current_level = 0.0
         self.max_level = 0.0
+        self._levels_dirty = True  # Set when the style hasn't seen the latest levels
         
         # Animation parameters from config
         self.frame_rate = config.WAVEFORM_FRAME_RATE
@@ -134,6 +138,7 @@ class WaveformOverlay:
             
             # Update current style
             self.current_style = new_style
+            self._levels_dirty = True
             
             # Clear canvas to avoid residual artifacts
             if self.canvas:
@@ -234,22 +239,18 @@ class WaveformOverlay:
     def update_audio_level(self, level: float):
         """Update the current audio level for waveform display.
         
+        Only the in-memory buffer is updated here; the style picks up the
+        latest levels once per drawn frame.
+        
         Args:
             level: Audio level (0.0 to 1.0)
         """
         self.current_level = max(0.0, min(1.0, level))
         self.max_level = max(self.max_level * 0.99, self.current_level)  # Decay max level
         
-        # Update rolling buffer
+        # Update rolling buffer (oldest level drops off automatically)
         self.audio_levels.append(self.current_level)
-        # Use configurable bar count
-        bar_count = config.WAVEFORM_BAR_COUNT
-        if len(self.audio_levels) > bar_count:
-            self.audio_levels.pop(0)
-            
-        # Update the current style with audio levels
-        if self.current_style:
-            self.current_style.update_audio_levels(self.audio_levels, self.current_level)
+        self._levels_dirty = True
             
     def _start_animation(self):
         """Start the animation thread."""
@@ -299,6 +300,11 @@ class WaveformOverlay:
             return
             
         try:
+            # Hand the style the levels accumulated since the last frame
+            if self._levels_dirty:
+                self.current_style.update_audio_levels(list(self.audio_levels), self.current_level)
+                self._levels_dirty = False
+            
             # Clear canvas
             self.current_style.clear_canvas()
             
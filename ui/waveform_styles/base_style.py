@@ -7,6 +7,7 @@ from tkinter import Canvas
 from typing import List, Dict, Any, Optional, Tuple
 import math
 import time
+from config import config
 
 
 class BaseWaveformStyle(ABC):
@@ -88,9 +89,6 @@ class BaseWaveformStyle(ABC):
         Returns:
             Progress from 0.0 (start) to 1.0 (end)
         """
-        # Import here to avoid circular imports
-        from config import config
-        
         # This will be set by the overlay when entering canceling state
         if hasattr(self, '_canceling_start_time'):
             cancellation_duration = config.CANCELLATION_ANIMATION_DURATION_MS / 1000.0
@@ -162,7 +162,6 @@ class NeonMatrixStyle(BaseWaveformStyle):
         progress = self.get_cancellation_progress()
         
         # Matrix effect dissolution - characters randomly disappear
-        import random
         char_count = 12
         char_spacing = self.width // (char_count + 1)
         
@@ -3,47 +3,185 @@ Whisper model management dialog.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import os
+import re
+import functools
+import time
+import hashlib
+import queue
 import threading
 import logging
+import urllib.request
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Optional, Set, List, Tuple, Dict, Callable
 from settings import settings_manager
 from config import config
 
+# Model files and the partial files a download can leave behind
+_MODEL_FILE_RE = re.compile(r'\.(pt|tmp|part|download)$')
+
+# Bytes read per chunk when downloading a model, and how often progress is shown
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_PROGRESS_INTERVAL_SEC = 0.1
+
+# Seconds a stalled connection may block before the download fails
+_DOWNLOAD_TIMEOUT_SEC = 30
+
+# whisper pulls in torch, so it is imported once, off the UI thread
+_whisper = None
+_whisper_lock = threading.Lock()
+
+
+def _get_whisper():
+    """Import the whisper package on first use.
+
+    Returns:
+        The whisper module.
+    """
+    global _whisper
+    with _whisper_lock:
+        if _whisper is None:
+            import whisper
+            _whisper = whisper
+        return _whisper
+
+
+def _preload_whisper():
+    """Import whisper in the background so the first download starts quickly."""
+    try:
+        _get_whisper()
+    except Exception as e:
+        logging.warning(f"Failed to preload whisper: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def _whisper_cache_dir() -> Path:
+    """Get the Whisper model cache directory.
+
+    It can't change while the app runs, so it is worked out once.
+
+    Returns:
+        Path to the directory whisper downloads models into.
+    """
+    # Check environment variable first
+    cache_root = os.environ.get('XDG_CACHE_HOME')
+    if cache_root:
+        return Path(cache_root) / 'whisper'
+
+    # Default to the user's home directory (same layout on Windows, Linux and Mac)
+    return Path.home() / '.cache' / 'whisper'
+
+
+# Fonts used by the dialog: name -> (size, weight)
+_FONT_SPECS = {
+    'header': (16, 'bold'),
+    'title': (11, 'bold'),
+    'status': (12, 'normal'),
+    'body': (10, 'normal'),
+    'button': (9, 'normal'),
+    'heading': (9, 'bold'),
+    'small': (8, 'normal'),
+}
+
+# Shared fonts and the Tcl interpreter they and the styles were created in
+_FONTS: Dict[str, tkfont.Font] = {}
+_resources_tk = None
+
+
+def _install_styles(style: ttk.Style):
+    """Configure the dialog's ttk styles.
+
+    Args:
+        style: Style object of the dialog's Tk interpreter.
+    """
+    style.configure('ModelDialog.Treeview',
+                   background='#1a1a1a',
+                   fieldbackground='#1a1a1a',
+                   foreground=config.WAVEFORM_TEXT_COLOR,
+                   borderwidth=0,
+                   rowheight=32,
+                   font=_FONTS['body'])
+    style.map('ModelDialog.Treeview',
+              background=[('selected', config.WAVEFORM_SECONDARY_COLOR)],
+              foreground=[('selected', 'white')])
+    style.configure('ModelDialog.Treeview.Heading',
+                   background='#2a2a2a',
+                   foreground='#b0b0b0',
+                   relief='flat',
+                   font=_FONTS['heading'])
+
+    # Style for close button
+    style.configure('ModelDialogCancel.TButton',
+                   background='#444444',
+                   foreground='white',
+                   borderwidth=0,
+                   focuscolor='none',
+                   font=_FONTS['body'],
+                   padding=(12, 8))
+
+
+def _init_resources(root: tk.Misc):
+    """Create the shared fonts and styles once per Tk interpreter.
+
+    Args:
+        root: Any widget of the interpreter the dialog runs in.
+    """
+    global _resources_tk
+    if _resources_tk is root.tk:
+        return
+
+    _FONTS.clear()
+    for name, (size, weight) in _FONT_SPECS.items():
+        _FONTS[name] = tkfont.Font(root=root, family="Segoe UI", size=size, weight=weight)
+    _install_styles(ttk.Style(root))
+    _resources_tk = root.tk
+
+
+# Model information: (name, size, description, speed, recommended)
+# Using English-only models (.en) for better performance and accuracy
+MODELS_TABLE: Tuple[Tuple[str, str, str, str, bool], ...] = (
+    ('tiny.en', '~75 MB',
+     'Fastest, least accurate. Good for quick drafts. English-only.',
+     'Very Fast', False),
+    ('base.en', '~145 MB',
+     'Balanced speed and accuracy. Recommended for most users. English-only.',
+     'Fast', True),
+    ('small.en', '~470 MB',
+     'Better accuracy, slower processing. English-only.',
+     'Moderate', False),
+    ('medium.en', '~1.5 GB',
+     'High accuracy, significantly slower. English-only.',
+     'Slow', False),
+    ('large-v2', '~3 GB',
+     'Best accuracy, very slow processing. Multi-language (no .en variant available).',
+     'Very Slow', False),
+)
+
+# Model rows by name, for the dialogs that need one model's details
+MODELS_BY_NAME = {row[0]: row for row in MODELS_TABLE}
+
 
 class WhisperModelDialog:
     """Dialog for managing Whisper models."""
 
-    # Model information: name, size, description
-    # Using English-only models (.en) for better performance and accuracy
-    MODELS = {
-        'tiny.en': {
-            'size': '~75 MB',
-            'description': 'Fastest, least accurate. Good for quick drafts. English-only.',
-            'speed': 'Very Fast'
-        },
-        'base.en': {
-            'size': '~145 MB',
-            'description': 'Balanced speed and accuracy. Recommended for most users. English-only.',
-            'speed': 'Fast',
-            'recommended': True
-        },
-        'small.en': {
-            'size': '~470 MB',
-            'description': 'Better accuracy, slower processing. English-only.',
-            'speed': 'Moderate'
-        },
-        'medium.en': {
-            'size': '~1.5 GB',
-            'description': 'High accuracy, significantly slower. English-only.',
-            'speed': 'Slow'
-        },
-        'large-v2': {
-            'size': '~3 GB',
-            'description': 'Best accuracy, very slow processing. Multi-language (no .en variant available).',
-            'speed': 'Very Slow'
-        }
-    }
+    # Delay before a model selection is applied, so rapid changes collapse into one
+    SELECTION_DEBOUNCE_MS = 50
+
+    # Confirmation messages, filled in with the model's details
+    _DOWNLOAD_CONFIRM_TMPL = (
+        "Download the '{name}' model?\n\n"
+        "Size: {size}\n"
+        "Speed: {speed}\n\n"
+        "The model will be downloaded from OpenAI's servers.\n"
+        "This may take several minutes depending on your internet connection."
+    )
+    _DELETE_CONFIRM_TMPL = (
+        "Delete the '{name}' model?\n\n"
+        "Size: {size}\n\n"
+        "This will free up disk space, but you'll need to download it again if you want to use it later."
+    )
 
     def __init__(self, parent=None, backend=None):
         """Initialize the Whisper model dialog.
@@ -57,46 +195,95 @@ class WhisperModelDialog:
         self.dialog = None
         self.model_vars = {}
 
-        # Load current model from settings
+        # Load current model from settings; a change is written back once on close
         settings = settings_manager.load_all_settings()
+        self._settings_dirty = False
         self.current_model = settings.get('whisper_model', config.DEFAULT_WHISPER_MODEL)
         self.selected_model = None  # Will be created after dialog window exists
         self.downloading = False
-        self.download_cancelled = False
         self.current_download_model = None
+        # Cancel token of the running download; each download gets its own
+        self._download_cancel: Optional[threading.Event] = None
+
+        # Job queue of the single daemon worker that runs downloads; created
+        # when the dialog is shown
+        self._jobs: Optional[queue.Queue] = None
+
+        # Set once the dialog starts closing, so late worker callbacks are dropped
+        self._closing = False
+
+        # Pending debounced selection and re-entrancy guard for the trace
+        self._pending_after = None
+        self._trace_busy = False
 
         # Get cache directory
-        self.cache_dir = self._get_whisper_cache_dir()
-
-    def _get_whisper_cache_dir(self) -> Path:
-        """Get the Whisper model cache directory."""
-        # Check environment variable first
-        cache_root = os.environ.get('XDG_CACHE_HOME')
-        if cache_root:
-            return Path(cache_root) / 'whisper'
-
-        # Default to user's home directory
-        home = Path.home()
-        if os.name == 'nt':  # Windows
-            return home / '.cache' / 'whisper'
-        else:  # Linux/Mac
-            return home / '.cache' / 'whisper'
+        self.cache_dir = _whisper_cache_dir()
+
+        # Cache directory listing and the downloaded models found in it;
+        # None until the cache directory is scanned
+        self._entries: Optional[List[Tuple[str, str]]] = None
+        self._downloaded_cache: Optional[Set[str]] = None
+
+    def _list_cache(self, refresh: bool = False) -> List[Tuple[str, str]]:
+        """List the model and partial download files in the cache directory.
+
+        The directory is read with a single scandir and the listing is reused
+        until the cache is invalidated.
+
+        Args:
+            refresh: Re-read the directory even if a listing is cached.
+
+        Returns:
+            List of (file name, path) tuples.
+        """
+        if self._entries is None or refresh:
+            try:
+                with os.scandir(self.cache_dir) as it:
+                    self._entries = [(entry.name, entry.path) for entry in it
+                                     if _MODEL_FILE_RE.search(entry.name)]
+            except OSError:
+                self._entries = []
+        return self._entries
+
+    def _invalidate_cache(self):
+        """Forget the cache directory listing after files were added or removed."""
+        self._entries = None
+        self._downloaded_cache = None
+
+    def _scan_cache_dir(self) -> Set[str]:
+        """Scan the cache directory once and record which models are downloaded.
+
+        Returns:
+            Names of the downloaded models.
+        """
+        entries = [name for name, _ in self._list_cache(refresh=True) if name.endswith('.pt')]
+
+        downloaded = set()
+        for model_name in MODELS_BY_NAME:
+            if any(name.startswith(model_name) for name in entries):
+                downloaded.add(model_name)
+
+        self._downloaded_cache = downloaded
+        return downloaded
 
     def _is_model_downloaded(self, model_name: str) -> bool:
         """Check if a model is already downloaded.
 
+        Uses the result of the last cache directory scan. After the cache has
+        been invalidated by a download or delete, the usual file name is
+        checked with a single stat before falling back to a rescan.
+
         Args:
             model_name: Name of the model to check.
 
         Returns:
             True if model is downloaded, False otherwise.
         """
-        if not self.cache_dir.exists():
-            return False
-
-        # Check for .pt files matching the model name
-        model_files = list(self.cache_dir.glob(f'{model_name}*.pt'))
-        return len(model_files) > 0
+        if self._downloaded_cache is None:
+            if (self.cache_dir / f'{model_name}.pt').is_file():
+                return True
+            self._scan_cache_dir()
+        return model_name in self._downloaded_cache
 
     def show(self) -> bool:
         """Show the Whisper model management dialog.
@@ -104,11 +291,30 @@ class WhisperModelDialog:
         Returns:
             True if changes were made, False otherwise.
         """
+        # Never build a second window on top of one that is still open
+        if self._dialog_open():
+            logging.warning("Whisper model dialog is already open")
+            self.dialog.lift()
+            self.dialog.focus_force()
+            return False
+
+        # Pick up models downloaded or deleted since the dialog was last shown
+        self._scan_cache_dir()
+
         self.dialog = tk.Toplevel(self.parent) if self.parent else tk.Tk()
         self.dialog.title("Whisper Model Settings")
         self.dialog.geometry("600x650")
         self.dialog.resizable(False, False)
         self.dialog.configure(bg=config.WAVEFORM_BG_COLOR)
+        _init_resources(self.dialog)
+
+        self._jobs = queue.Queue()
+        threading.Thread(target=self._worker_loop, args=(self._jobs,),
+                         name='whisper-dl', daemon=True).start()
+        self._closing = False
+
+        # Route the window's close button through _close so settings get saved
+        self.dialog.protocol("WM_DELETE_WINDOW", self._close)
 
         # Create StringVar now that we have a dialog window
         self.selected_model = tk.StringVar(self.dialog, value=self.current_model)
@@ -127,6 +333,10 @@ class WhisperModelDialog:
         self.initialized = True
         self.selected_model.trace('w', self._on_model_selected)
 
+        # Warm up the whisper import before the user asks for a download;
+        # a download queues behind it on the same worker
+        self._submit(_preload_whisper)
+
         # Wait for dialog to close
         if self.parent:
             self.dialog.wait_window()
@@ -135,6 +345,20 @@ class WhisperModelDialog:
 
         return True
 
+    def _dialog_open(self) -> bool:
+        """Check if this dialog's window currently exists.
+
+        Returns:
+            True if the window exists, False otherwise.
+        """
+        if self.dialog is None:
+            return False
+        try:
+            return bool(self.dialog.winfo_exists())
+        except tk.TclError:
+            # Its Tk interpreter has been destroyed
+            return False
+
     def _create_widgets(self):
         """Create dialog widgets."""
         main_frame = tk.Frame(self.dialog, bg=config.WAVEFORM_BG_COLOR, padx=20, pady=20)
@@ -144,7 +368,7 @@ class WhisperModelDialog:
         header_label = tk.Label(
             main_frame,
             text="Whisper Model Settings",
-            font=("Segoe UI", 16, "bold"),
+            font=_FONTS['header'],
             bg=config.WAVEFORM_BG_COLOR,
             fg=config.WAVEFORM_ACCENT_COLOR
         )
@@ -154,7 +378,7 @@ class WhisperModelDialog:
         desc_label = tk.Label(
             main_frame,
             text="Manage and select Whisper models for local transcription",
-            font=("Segoe UI", 10),
+            font=_FONTS['body'],
             bg=config.WAVEFORM_BG_COLOR,
             fg="#b0b0b0"
         )
@@ -168,36 +392,118 @@ class WhisperModelDialog:
         cache_info = tk.Label(
             main_frame,
             text=f"Models are stored in: {self.cache_dir}",
-            font=("Segoe UI", 8),
+            font=_FONTS['small'],
             bg=config.WAVEFORM_BG_COLOR,
             fg="#808080",
             anchor='w'
         )
         cache_info.pack(fill=tk.X, pady=(0, 15))
 
-        # Models list frame with scrollbar
+        # Models list - one Treeview row per model
         list_frame = tk.Frame(main_frame, bg="#2a2a2a", bd=0)
-        list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+
+        self.tree = ttk.Treeview(
+            list_frame,
+            columns=('size', 'speed', 'status'),
+            show='tree headings',
+            selectmode='browse',
+            height=len(MODELS_TABLE),
+            style='ModelDialog.Treeview'
+        )
+        self.tree.heading('#0', text='Model', anchor='w')
+        self.tree.heading('size', text='Size', anchor='w')
+        self.tree.heading('speed', text='Speed', anchor='w')
+        self.tree.heading('status', text='Status', anchor='w')
+        self.tree.column('#0', width=220, stretch=True)
+        self.tree.column('size', width=80, stretch=False)
+        self.tree.column('speed', width=90, stretch=False)
+        self.tree.column('status', width=110, stretch=False)
+
+        self.scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
 
-        # Create canvas for scrolling
-        canvas = tk.Canvas(list_frame, bg="#2a2a2a", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#2a2a2a")
+        # Build model list
+        for model_name, size, speed, is_downloaded, is_recommended in self._build_model_view():
+            text = model_name.capitalize()
+            if is_recommended:
+                text += "  ⭐ RECOMMENDED"
+            self.tree.insert('', 'end', iid=model_name, text=text,
+                             values=(size, speed, self._status_text(model_name, is_downloaded)))
+
+        list_frame.grid_rowconfigure(0, weight=1)
+        list_frame.grid_columnconfigure(0, weight=1)
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+
+        self.tree.bind('<<TreeviewSelect>>', lambda e: self._update_actions())
+        self.tree.bind('<Double-1>', lambda e: self._use_selected())
+
+        # Description of the highlighted model
+        self.details_label = tk.Label(
+            main_frame,
+            text="",
+            font=_FONTS['button'],
+            bg=config.WAVEFORM_BG_COLOR,
+            fg="#b0b0b0",
+            anchor='w',
+            justify='left',
+            wraplength=540
+        )
+        self.details_label.pack(fill=tk.X, pady=(0, 10))
+
+        # Actions for the highlighted model
+        action_frame = tk.Frame(main_frame, bg=config.WAVEFORM_BG_COLOR)
+        action_frame.pack(fill=tk.X)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        self.use_btn = tk.Button(
+            action_frame,
+            text="Use Model",
+            font=_FONTS['button'],
+            bg=config.WAVEFORM_ACCENT_COLOR,
+            fg="white",
+            bd=0,
+            padx=15,
+            pady=6,
+            cursor="hand2",
+            command=self._use_selected
         )
+        self.use_btn.pack(side=tk.LEFT)
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.download_btn = tk.Button(
+            action_frame,
+            text="Download",
+            font=_FONTS['button'],
+            bg=config.WAVEFORM_SECONDARY_COLOR,
+            fg="white",
+            bd=0,
+            padx=15,
+            pady=6,
+            cursor="hand2",
+            command=lambda: self._download_model(self._highlighted_model(), self.download_btn)
+        )
+        self.download_btn.pack(side=tk.LEFT, padx=(8, 0))
 
-        # Build model list
-        for model_name, info in self.MODELS.items():
-            self._create_model_row(scrollable_frame, model_name, info)
+        self.delete_btn = tk.Button(
+            action_frame,
+            text="Delete",
+            font=_FONTS['button'],
+            bg="#cc0000",
+            fg="white",
+            bd=0,
+            padx=15,
+            pady=6,
+            cursor="hand2",
+            command=lambda: self._delete_model(self._highlighted_model())
+        )
+        self.delete_btn.pack(side=tk.LEFT, padx=(8, 0))
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # Start with the model in use highlighted
+        if self.tree.exists(self.current_model):
+            self.tree.selection_set(self.current_model)
+            self.tree.focus(self.current_model)
+            self.tree.see(self.current_model)
+        self._update_actions()
 
         # Buttons frame - needs to be created early so we can add progress to it
         button_frame = tk.Frame(main_frame, bg=config.WAVEFORM_BG_COLOR)
@@ -209,7 +515,7 @@ class WhisperModelDialog:
         self.progress_label = tk.Label(
             self.progress_section,
             text="Downloading model...",
-            font=("Segoe UI", 11, "bold"),
+            font=_FONTS['title'],
             bg="#2a2a2a",
             fg=config.WAVEFORM_ACCENT_COLOR,
             anchor='w'
@@ -219,7 +525,7 @@ class WhisperModelDialog:
         self.progress_status = tk.Label(
             self.progress_section,
             text="Downloading model, please wait...",
-            font=("Segoe UI", 12),
+            font=_FONTS['status'],
             bg="#2a2a2a",
             fg="#b0b0b0",
             anchor='center',
@@ -234,7 +540,7 @@ class WhisperModelDialog:
         self.cancel_download_btn = tk.Button(
             self.progress_section,
             text="✖  Cancel Download",
-            font=("Segoe UI", 11, "bold"),
+            font=_FONTS['title'],
             bg="#cc0000",
             fg="white",
             activebackground="#990000",
@@ -248,17 +554,6 @@ class WhisperModelDialog:
         )
         self.cancel_download_btn.pack(padx=15, pady=(0, 15))
 
-        # Style for close button
-        style = ttk.Style()
-
-        style.configure('ModelDialogCancel.TButton',
-                       background='#444444',
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       font=('Segoe UI', 10),
-                       padding=(12, 8))
-
         self.close_button = ttk.Button(
             button_frame,
             text="Close",
@@ -267,122 +562,99 @@ class WhisperModelDialog:
         )
         self.close_button.pack(fill=tk.X)
 
-    def _create_model_row(self, parent, model_name: str, info: dict):
-        """Create a row for a model.
+    def _on_tree_scroll(self, first: str, last: str):
+        """Update the scrollbar, hiding it while every row fits.
+
+        Args:
+            first: Fraction of the list above the visible rows.
+            last: Fraction of the list up to the last visible row.
+        """
+        if float(first) <= 0.0 and float(last) >= 1.0:
+            self.scrollbar.grid_remove()
+        else:
+            self.scrollbar.grid()
+        self.scrollbar.set(first, last)
+
+    def _build_model_view(self) -> List[Tuple[str, str, str, bool, bool]]:
+        """Work out each model's row state in one pass over the cache scan.
+
+        Returns:
+            List of (name, size, speed, is_downloaded, is_recommended) tuples.
+        """
+        downloaded = self._downloaded_cache
+        if downloaded is None:
+            downloaded = self._scan_cache_dir()
+
+        return [(model_name, size, speed, model_name in downloaded, recommended)
+                for model_name, size, _, speed, recommended in MODELS_TABLE]
+
+    def _status_text(self, model_name: str, is_downloaded: bool) -> str:
+        """Get the Status column text for a model.
 
         Args:
-            parent: Parent widget.
             model_name: Name of the model.
-            info: Model information dictionary.
+            is_downloaded: Whether the model is downloaded.
+
+        Returns:
+            Status text for the model's row.
         """
-        is_downloaded = self._is_model_downloaded(model_name)
-        is_recommended = info.get('recommended', False)
-
-        # Model row frame
-        row_frame = tk.Frame(parent, bg="#1a1a1a", bd=0)
-        row_frame.pack(fill=tk.X, padx=8, pady=4)
-
-        inner_frame = tk.Frame(row_frame, bg="#1a1a1a")
-        inner_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=10)
-
-        # Left side - radio button and model info
-        left_frame = tk.Frame(inner_frame, bg="#1a1a1a")
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        # Top row - name, recommended badge, downloaded checkmark
-        top_row = tk.Frame(left_frame, bg="#1a1a1a")
-        top_row.pack(fill=tk.X, pady=(0, 3))
-
-        # Radio button
-        radio = tk.Radiobutton(
-            top_row,
-            variable=self.selected_model,
-            value=model_name,
-            bg="#1a1a1a",
-            fg=config.WAVEFORM_TEXT_COLOR,
-            selectcolor="#2a2a2a",
-            activebackground="#1a1a1a",
-            activeforeground=config.WAVEFORM_ACCENT_COLOR,
-            font=("Segoe UI", 11, "bold"),
-            text=model_name.capitalize()
-        )
-        radio.pack(side=tk.LEFT)
-
-        # Recommended badge
-        if is_recommended:
-            rec_label = tk.Label(
-                top_row,
-                text="⭐ RECOMMENDED",
-                font=("Segoe UI", 8, "bold"),
-                bg="#1a1a1a",
-                fg=config.WAVEFORM_ACCENT_COLOR
-            )
-            rec_label.pack(side=tk.LEFT, padx=(8, 0))
-
-        # Downloaded checkmark
-        if is_downloaded:
-            check_label = tk.Label(
-                top_row,
-                text="✓ Downloaded",
-                font=("Segoe UI", 8),
-                bg="#1a1a1a",
-                fg="#4caf50"
-            )
-            check_label.pack(side=tk.LEFT, padx=(8, 0))
+        if not is_downloaded:
+            return ""
+        if model_name == self.current_model:
+            return "✓ In use"
+        return "✓ Downloaded"
 
-        # Description
-        desc_label = tk.Label(
-            left_frame,
-            text=info['description'],
-            font=("Segoe UI", 9),
-            bg="#1a1a1a",
-            fg="#b0b0b0",
-            anchor='w',
-            justify='left'
-        )
-        desc_label.pack(fill=tk.X, pady=(0, 2))
-
-        # Size and speed info
-        info_text = f"Size: {info['size']} • Speed: {info['speed']}"
-        info_label = tk.Label(
-            left_frame,
-            text=info_text,
-            font=("Segoe UI", 8),
-            bg="#1a1a1a",
-            fg="#808080",
-            anchor='w'
-        )
-        info_label.pack(fill=tk.X)
+    def _highlighted_model(self) -> Optional[str]:
+        """Get the model highlighted in the list.
+
+        Returns:
+            Name of the highlighted model, or None if nothing is highlighted.
+        """
+        selection = self.tree.selection()
+        return selection[0] if selection else None
+
+    def _update_actions(self):
+        """Update the description and action buttons for the highlighted model."""
+        model_name = self._highlighted_model()
+        if model_name is None:
+            self.details_label.config(text="")
+            for button in (self.use_btn, self.download_btn, self.delete_btn):
+                button.config(state=tk.DISABLED)
+            return
 
-        # Right side - download/delete button
+        is_downloaded = self._is_model_downloaded(model_name)
+        in_use = model_name == self.current_model
+
+        details = MODELS_BY_NAME[model_name][2]
         if not is_downloaded:
-            download_btn = tk.Button(
-                inner_frame,
-                text="Download",
-                font=("Segoe UI", 9),
-                bg=config.WAVEFORM_SECONDARY_COLOR,
-                fg="white",
-                bd=0,
-                padx=15,
-                pady=6,
-                cursor="hand2",
-                command=lambda: self._download_model(model_name, download_btn)
-            )
-            download_btn.pack(side=tk.RIGHT)
-        else:
-            delete_btn = tk.Button(
-                inner_frame,
-                text="Delete",
-                font=("Segoe UI", 9),
-                bg="#cc0000",
-                fg="white",
-                bd=0,
-                padx=15,
-                pady=6,
-                cursor="hand2",
-                command=lambda: self._delete_model(model_name, row_frame)
-            )
-            delete_btn.pack(side=tk.RIGHT)
+            details += "\nNot downloaded yet. Download it to use this model."
+        self.details_label.config(text=details)
+
+        self.use_btn.config(state=tk.NORMAL if is_downloaded and not in_use else tk.DISABLED)
+        self.delete_btn.config(state=tk.NORMAL if is_downloaded and not in_use else tk.DISABLED)
+
+        # While downloading, the download button shows the running download
+        if not self.downloading:
+            self.download_btn.config(text="Download",
+                                     state=tk.DISABLED if is_downloaded else tk.NORMAL,
+                                     bg=config.WAVEFORM_SECONDARY_COLOR)
+
+    def _use_selected(self):
+        """Switch to the highlighted model."""
+        model_name = self._highlighted_model()
+        if model_name is not None and model_name != self.selected_model.get():
+            self.selected_model.set(model_name)
+
+    def _refresh_row(self, model_name: str):
+        """Update one model row after its model was downloaded, deleted, or put in use.
+
+        Args:
+            model_name: Name of the model whose row changed.
+        """
+        if self.tree.exists(model_name):
+            self.tree.set(model_name, 'status',
+                          self._status_text(model_name, self._is_model_downloaded(model_name)))
+        self._update_actions()
 
     def _download_model(self, model_name: str, button: tk.Button):
         """Download a Whisper model.
@@ -396,57 +668,249 @@ class WhisperModelDialog:
                                  "Another model is currently being downloaded. Please wait.")
             return
 
-        model_info = self.MODELS[model_name]
+        _, size, _, speed, _ = MODELS_BY_NAME[model_name]
 
         # Confirm download
         response = messagebox.askyesno(
             "Confirm Download",
-            f"Download the '{model_name}' model?\n\n"
-            f"Size: {model_info['size']}\n"
-            f"Speed: {model_info['speed']}\n\n"
-            f"The model will be downloaded from OpenAI's servers.\n"
-            f"This may take several minutes depending on your internet connection."
+            self._DOWNLOAD_CONFIRM_TMPL.format_map({'name': model_name, 'size': size, 'speed': speed})
         )
 
         if not response:
             return
 
         self.downloading = True
-        self.download_cancelled = False
         self.current_download_model = model_name
+        cancel_event = threading.Event()
+        self._download_cancel = cancel_event
         button.config(text="Downloading...", state=tk.DISABLED, bg="#666666")
 
         # Show progress section ABOVE the close button
-        self.progress_label.config(text=f"Downloading '{model_name}' model ({model_info['size']})...")
+        self.progress_label.config(text=f"Downloading '{model_name}' model ({size})...")
+        self.progress_status.config(text="Starting download...")
+        self.cancel_download_btn.config(state=tk.NORMAL, text="✖  Cancel Download")
         self.progress_section.pack(fill=tk.X, pady=(0, 15))
 
         # Disable Close button during download
         self.close_button.config(state=tk.DISABLED)
 
-        # Force immediate UI update
-        self.dialog.update()
+        # Lay out the progress section before the download starts, without
+        # re-entering event processing
+        self.progress_section.update_idletasks()
 
-        # Download in background thread
-        def download_thread():
+        # Download on the dialog's worker thread
+        future = self._submit(self._do_download, model_name, cancel_event)
+        future.add_done_callback(lambda f: self._on_download_done(f, model_name, button, cancel_event))
+
+    @staticmethod
+    def _worker_loop(jobs: queue.Queue):
+        """Run queued jobs until a None job arrives. Runs on the worker thread.
+
+        The thread is a daemon so the app can always exit, even while a
+        download is still waiting on the network.
+
+        Args:
+            jobs: Queue of (future, function, args) jobs.
+        """
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            future, fn, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
             try:
-                import whisper
-                # This will download the model if not present
-                whisper.load_model(model_name)
-
-                # Check if cancelled
-                if not self.download_cancelled:
-                    # Update UI on main thread
-                    self.dialog.after(0, lambda: self._download_complete(model_name, button, True))
-                else:
-                    # Download completed but was cancelled - delete the files
-                    self.dialog.after(0, lambda: self._cleanup_cancelled_download(model_name, button))
-            except Exception as e:
-                if not self.download_cancelled:
-                    # Update UI on main thread
-                    self.dialog.after(0, lambda: self._download_complete(model_name, button, False, str(e)))
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        """Queue a job for the worker thread.
+
+        Args:
+            fn: Function to run.
+            *args: Arguments for the function.
+
+        Returns:
+            Future for the job's result.
+        """
+        future = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+    def _do_download(self, model_name: str, cancel_event: threading.Event) -> Optional[str]:
+        """Download a model, posting progress to the dialog. Runs on the worker thread.
 
-        thread = threading.Thread(target=download_thread, daemon=True)
-        thread.start()
+        Args:
+            model_name: Name of the model to download.
+            cancel_event: Set to cancel this download.
+
+        Returns:
+            Path to the downloaded model file, or None if cancelled.
+        """
+        def on_progress(done, total):
+            # A cancelled download's late progress must not overwrite a newer one's
+            if not cancel_event.is_set():
+                self._post(self._show_download_progress, done, total)
+
+        return self._fetch_model(model_name, on_progress, cancel_event)
+
+    def _on_download_done(self, future: Future, model_name: str, button: tk.Button,
+                          cancel_event: threading.Event):
+        """Hand a finished download back to the UI thread.
+
+        Args:
+            future: Future of the _do_download call.
+            model_name: Name of the downloaded model.
+            button: The download button.
+            cancel_event: Cancel token of this download.
+        """
+        try:
+            future.result()
+        except Exception as e:
+            if not cancel_event.is_set():
+                # Update UI on main thread
+                self._post(self._download_complete, model_name, button, False, str(e))
+                return
+
+        if not cancel_event.is_set():
+            # Update UI on main thread
+            self._post(self._download_complete, model_name, button, True)
+        else:
+            # Download was stopped or finished after cancelling - delete any files left
+            self._post(self._cleanup_cancelled_download, model_name, button)
+
+    def _post(self, callback: Callable, *args):
+        """Run a callback on the Tk thread, unless the dialog is closing.
+
+        Safe to call from the worker thread after the dialog is gone.
+
+        Args:
+            callback: Function to call on the Tk thread.
+            *args: Arguments for the callback.
+        """
+        if self._closing:
+            return
+        try:
+            self.dialog.after(0, self._run_posted, callback, args)
+        except (tk.TclError, RuntimeError):
+            # The dialog was destroyed between the check and the call
+            pass
+
+    def _run_posted(self, callback: Callable, args: tuple):
+        """Run a callback posted by _post if the dialog is still open.
+
+        Args:
+            callback: Function to call.
+            args: Arguments for the callback.
+        """
+        if not self._closing:
+            callback(*args)
+
+    def _fetch_model(self, model_name: str, on_progress: Callable[[int, int], None],
+                     cancel_event: threading.Event) -> Optional[str]:
+        """Download a model file into the cache directory.
+
+        Uses the same URL, file name, and SHA256 check as whisper's own
+        downloader, but reads the stream in chunks so progress can be shown.
+        The file is written under a .part name and only moved into place once
+        its checksum matches. Cancelling stops the transfer at the next chunk;
+        the partial file is deleted on cancel and on any failure.
+
+        Args:
+            model_name: Name of the model to download.
+            on_progress: Called with (bytes downloaded, total bytes) at most
+                every _PROGRESS_INTERVAL_SEC. Total is 0 if unknown.
+            cancel_event: Set to stop the download.
+
+        Returns:
+            Path to the downloaded model file, or None if the download was
+            cancelled.
+
+        Raises:
+            Exception: If the downloaded file fails its checksum.
+            OSError: If the connection fails or stalls for longer than
+                _DOWNLOAD_TIMEOUT_SEC.
+        """
+        whisper = _get_whisper()
+        url = getattr(whisper, '_MODELS', {}).get(model_name)
+        if url is None:
+            # Unknown to this whisper version's URL table; let whisper fetch it
+            whisper.load_model(model_name)
+            return str(self.cache_dir / f'{model_name}.pt')
+
+        expected_sha256 = url.split('/')[-2]
+        os.makedirs(self.cache_dir, exist_ok=True)
+        target = os.path.join(self.cache_dir, os.path.basename(url))
+        partial = target + '.part'
+
+        sha256 = hashlib.sha256()
+        cancelled = False
+        try:
+            with urllib.request.urlopen(url, timeout=_DOWNLOAD_TIMEOUT_SEC) as source, open(partial, 'wb') as output:
+                total = int(source.info().get('Content-Length') or 0)
+                done = 0
+                last_report = 0.0
+                while True:
+                    if cancel_event.is_set():
+                        cancelled = True
+                        break
+
+                    chunk = source.read(_DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    output.write(chunk)
+                    sha256.update(chunk)
+                    done += len(chunk)
+
+                    now = time.monotonic()
+                    if now - last_report >= _PROGRESS_INTERVAL_SEC:
+                        last_report = now
+                        on_progress(done, total)
+        except BaseException:
+            # A failed or stalled transfer must not leave the partial file behind
+            try:
+                os.remove(partial)
+            except OSError:
+                pass
+            raise
+
+        if cancelled:
+            # Leaving the with block closed the connection; drop what we got
+            try:
+                os.remove(partial)
+            except OSError:
+                pass
+            logging.info(f"Download of '{model_name}' cancelled after {done} bytes")
+            return None
+
+        on_progress(done, total)
+
+        if sha256.hexdigest() != expected_sha256:
+            os.remove(partial)
+            raise Exception("The downloaded model does not match its checksum. Please try again.")
+
+        os.replace(partial, target)
+        return target
+
+    def _show_download_progress(self, done: int, total: int):
+        """Show how much of the model has been downloaded.
+
+        Args:
+            done: Bytes downloaded so far.
+            total: Total bytes, or 0 if unknown.
+        """
+        if not self.downloading:
+            return
+
+        done_mb = done / (1024 * 1024)
+        if total:
+            total_mb = total / (1024 * 1024)
+            percent = done * 100 // total
+            text = f"{done_mb:.1f} MB of {total_mb:.1f} MB ({percent}%)"
+        else:
+            text = f"{done_mb:.1f} MB downloaded"
+        self.progress_status.config(text=text)
 
     def _cancel_download(self):
         """Cancel the current download."""
@@ -457,13 +921,14 @@ class WhisperModelDialog:
         )
 
         if response:
-            self.download_cancelled = True
+            if self._download_cancel is not None:
+                self._download_cancel.set()
             self.downloading = False
 
             # Update UI immediately
             self.progress_status.config(text="Cancelling download...")
             self.cancel_download_btn.config(state=tk.DISABLED, text="Cancelling...")
-            self.dialog.update()
+            self.progress_section.update_idletasks()
 
             # Try to delete partial downloads immediately
             if self.current_download_model:
@@ -478,32 +943,31 @@ class WhisperModelDialog:
     def _delete_partial_downloads(self, model_name: str):
         """Delete any partially downloaded model files."""
         try:
-            if self.cache_dir.exists():
-                # Look for partial downloads (might have .tmp, .part, or incomplete .pt files)
-                import glob
-                patterns = [
-                    f'{model_name}*.pt',
-                    f'{model_name}*.tmp',
-                    f'{model_name}*.part',
-                    f'{model_name}*.download'
-                ]
-
-                for pattern in patterns:
-                    files = list(self.cache_dir.glob(pattern))
-                    for file in files:
-                        try:
-                            file.unlink()
-                            logging.info(f"Deleted partial download: {file}")
-                        except:
-                            pass
+            # Partial downloads might be .tmp, .part, .download, or incomplete .pt files
+            for name, path in self._list_cache(refresh=True):
+                if name.startswith(model_name):
+                    try:
+                        os.unlink(path)
+                        logging.info(f"Deleted partial download: {path}")
+                    except OSError:
+                        pass
         except Exception as e:
             logging.error(f"Failed to delete partial downloads: {e}")
+        finally:
+            self._invalidate_cache()
 
     def _cleanup_cancelled_download(self, model_name: str, button: tk.Button):
         """Clean up after a cancelled download that completed."""
+        if self.downloading:
+            # A newer download is running; leave its files and button alone
+            if model_name != self.current_download_model:
+                self._delete_partial_downloads(model_name)
+            return
+
         # Delete the downloaded model since user cancelled
         self._delete_partial_downloads(model_name)
         button.config(text="Download", state=tk.NORMAL, bg=config.WAVEFORM_SECONDARY_COLOR)
+        self._update_actions()
 
     def _download_complete(self, model_name: str, button: tk.Button, success: bool, error: str = None):
         """Handle download completion.
@@ -515,6 +979,7 @@ class WhisperModelDialog:
             error: Error message if failed.
         """
         self.downloading = False
+        self._invalidate_cache()
 
         # Hide progress section
         self.progress_section.pack_forget()
@@ -522,22 +987,20 @@ class WhisperModelDialog:
         if success:
             messagebox.showinfo("Download Complete",
                               f"The '{model_name}' model has been downloaded successfully!")
-            # Refresh dialog to show delete button
-            self.dialog.destroy()
-            self.show()
+            # Mark the row as downloaded
+            self._refresh_row(model_name)
         else:
             button.config(text="Download Failed", state=tk.NORMAL, bg=config.WAVEFORM_SECONDARY_COLOR)
             messagebox.showerror("Download Failed",
                                f"Failed to download the '{model_name}' model.\n\nError: {error}")
 
-    def _delete_model(self, model_name: str, row_frame: tk.Frame):
+    def _delete_model(self, model_name: str):
         """Delete a downloaded Whisper model.
 
         Args:
             model_name: Name of the model to delete.
-            row_frame: The row frame to refresh after deletion.
         """
-        model_info = self.MODELS[model_name]
+        size = MODELS_BY_NAME[model_name][1]
 
         # Check if this is the currently selected model
         if self.selected_model.get() == model_name:
@@ -551,9 +1014,7 @@ class WhisperModelDialog:
         # Confirm deletion
         response = messagebox.askyesno(
             "Confirm Deletion",
-            f"Delete the '{model_name}' model?\n\n"
-            f"Size: {model_info['size']}\n\n"
-            f"This will free up disk space, but you'll need to download it again if you want to use it later."
+            self._DELETE_CONFIRM_TMPL.format_map({'name': model_name, 'size': size})
         )
 
         if not response:
@@ -562,21 +1023,20 @@ class WhisperModelDialog:
         try:
             # Find and delete model files
             deleted_files = []
-            if self.cache_dir.exists():
-                model_files = list(self.cache_dir.glob(f'{model_name}*.pt'))
-                for model_file in model_files:
-                    model_file.unlink()
-                    deleted_files.append(model_file.name)
+            for name, path in self._list_cache(refresh=True):
+                if name.startswith(model_name) and name.endswith('.pt'):
+                    os.unlink(path)
+                    deleted_files.append(name)
+            self._invalidate_cache()
 
             if deleted_files:
                 messagebox.showinfo(
                     "Model Deleted",
                     f"The '{model_name}' model has been deleted successfully.\n\n"
-                    f"Freed up approximately {model_info['size']} of disk space."
+                    f"Freed up approximately {size} of disk space."
                 )
-                # Refresh the dialog to update UI
-                self.dialog.destroy()
-                self.show()
+                # Mark the row as no longer downloaded
+                self._refresh_row(model_name)
             else:
                 messagebox.showwarning(
                     "No Files Found",
@@ -584,17 +1044,37 @@ class WhisperModelDialog:
                 )
 
         except Exception as e:
+            self._invalidate_cache()
             messagebox.showerror(
                 "Delete Failed",
                 f"Failed to delete the '{model_name}' model.\n\nError: {e}"
             )
 
     def _on_model_selected(self, *args):
-        """Handle model selection change via radio button."""
-        # Don't process during initialization
-        if not self.initialized:
+        """Handle a change of the model in use.
+
+        The change is applied after a short delay so that several quick
+        changes only load settings and the model once.
+        """
+        # Don't process during initialization or our own reverts
+        if not self.initialized or self._trace_busy:
             return
 
+        if self._pending_after:
+            self.dialog.after_cancel(self._pending_after)
+        self._pending_after = self.dialog.after(self.SELECTION_DEBOUNCE_MS, self._apply_selection)
+
+    def _revert_selection(self):
+        """Put the selection back to the model in use without re-triggering the trace."""
+        self._trace_busy = True
+        try:
+            self.selected_model.set(self.current_model)
+        finally:
+            self._trace_busy = False
+
+    def _apply_selection(self):
+        """Apply the selected model."""
+        self._pending_after = None
         selected = self.selected_model.get()
 
         # Check if model is downloaded
@@ -605,7 +1085,7 @@ class WhisperModelDialog:
                 f"Please download it first using the 'Download' button."
             )
             # Revert selection
-            self.selected_model.set(self.current_model)
+            self._revert_selection()
             return
 
         # Only apply if different from current
@@ -615,10 +1095,8 @@ class WhisperModelDialog:
         # Save to config
         config.DEFAULT_WHISPER_MODEL = selected
 
-        # Save to settings
-        settings = settings_manager.load_all_settings()
-        settings['whisper_model'] = selected
-        settings_manager.save_all_settings(settings)
+        # Save to settings when the dialog closes
+        self._settings_dirty = True
 
         # Reload the model in the backend if available
         if self.backend:
@@ -634,7 +1112,7 @@ class WhisperModelDialog:
                     f"Failed to load the '{selected}' model: {e}"
                 )
                 # Revert on error
-                self.selected_model.set(self.current_model)
+                self._revert_selection()
                 return
         else:
             messagebox.showinfo(
@@ -643,10 +1121,31 @@ class WhisperModelDialog:
             )
 
         # Update current model
+        previous_model = self.current_model
         self.current_model = selected
+        self._refresh_row(previous_model)
+        self._refresh_row(selected)
+
+    def _save_model_setting(self):
+        """Write the model in use to settings.
+
+        Settings are re-read first so that values saved while the dialog was
+        open (e.g. ffmpeg_path from a model reload) are kept. A failed save is
+        logged rather than keeping the dialog from closing.
+        """
+        try:
+            settings = settings_manager.load_all_settings()
+            settings['whisper_model'] = self.current_model
+            settings_manager.save_all_settings(settings)
+            self._settings_dirty = False
+        except Exception as e:
+            logging.error(f"Failed to save Whisper model setting: {e}")
 
     def _close(self):
         """Close dialog."""
+        if self._closing:
+            return
+
         if self.downloading:
             response = messagebox.askyesno(
                 "Download in Progress",
@@ -655,7 +1154,8 @@ class WhisperModelDialog:
             )
             if response:
                 # Cancel the download
-                self.download_cancelled = True
+                if self._download_cancel is not None:
+                    self._download_cancel.set()
                 self.downloading = False
                 if self.current_download_model:
                     self._delete_partial_downloads(self.current_download_model)
@@ -663,7 +1163,25 @@ class WhisperModelDialog:
                 # Don't close if they don't want to cancel
                 return
 
-        self.dialog.destroy()
+        # Apply a selection that is still waiting out the debounce
+        if self._pending_after:
+            self.dialog.after_cancel(self._pending_after)
+            self._apply_selection()
+
+        if self._settings_dirty:
+            self._save_model_setting()
+
+        # From here on, callbacks from the worker are dropped
+        self._closing = True
+
+        # The worker exits after its current job; a cancelled download stops
+        # at its next chunk or network timeout, so don't wait for it
+        if self._jobs is not None:
+            self._jobs.put(None)
+            self._jobs = None
+
+        # Destroy once pending idle tasks have run
+        self.dialog.after_idle(self.dialog.destroy)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,156 @@
+"""
+Shared thread pool for chunk transcription.
+Keeps one pool alive across bursts of work and shuts it down once idle.
+"""
+import sys
+import threading
+import logging
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Set
+
+from config import config
+
+
+def _shutdown_now(pool: ThreadPoolExecutor):
+    """Shut a pool down without waiting, dropping queued work where supported.
+    
+    Args:
+        pool: The pool to shut down.
+    """
+    if sys.version_info >= (3, 9):
+        pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        # cancel_futures is 3.9+; queued work still runs, but callers cancel
+        # their own futures before shutting down
+        pool.shutdown(wait=False)
+
+
+class WorkerPoolContext:
+    """Hands out a lazily created, reference-counted thread pool.
+    
+    The pool is created on first use and resized when an idle pool doesn't
+    match what a caller needs. A caller never gets a pool with more workers
+    than it asked for, since backends use that number as a concurrency cap.
+    Once the last user returns the pool, an idle timer shuts it down so no
+    threads linger between jobs.
+    """
+    
+    def __init__(self, idle_timeout_sec: float = None, thread_name_prefix: str = "chunk"):
+        """Initialize the pool context.
+        
+        Args:
+            idle_timeout_sec: Seconds the pool may sit unused before it is shut
+                down. Uses config default if None.
+            thread_name_prefix: Name prefix for the pool's threads.
+        """
+        self.idle_timeout_sec = (config.WORKER_POOL_IDLE_TIMEOUT_SEC
+                                 if idle_timeout_sec is None else idle_timeout_sec)
+        self.thread_name_prefix = thread_name_prefix
+        
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_size = 0
+        self._users = 0
+        self._idle_timer: Optional[threading.Timer] = None
+        # Exact-size pools handed out while the shared pool was busy and too large
+        self._private: Set[ThreadPoolExecutor] = set()
+    
+    def get_pool(self, max_workers: int) -> ThreadPoolExecutor:
+        """Get the shared pool, sized for the given number of workers.
+        
+        An unused pool of a different size is replaced by one of the requested
+        size. While the pool is in use, callers share it if it is no larger
+        than requested; otherwise they get a private pool of their own size.
+        Every call must be paired with return_pool().
+        
+        Args:
+            max_workers: Maximum number of workers the caller may run at once.
+        
+        Returns:
+            A thread pool with at most max_workers threads.
+        """
+        max_workers = max(1, max_workers)
+        with self._lock:
+            if self._pool is not None and self._users > 0 and self._pool_size > max_workers:
+                pool = ThreadPoolExecutor(max_workers=max_workers,
+                                          thread_name_prefix=self.thread_name_prefix)
+                self._private.add(pool)
+                return pool
+            
+            self._cancel_idle_timer()
+            
+            if self._pool is None or (self._pool_size != max_workers and self._users == 0):
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix=self.thread_name_prefix)
+                self._pool_size = max_workers
+                logging.info(f"Started worker pool with {max_workers} threads")
+            
+            self._users += 1
+            return self._pool
+    
+    def return_pool(self, pool: ThreadPoolExecutor):
+        """Release a pool obtained from get_pool().
+        
+        Args:
+            pool: The pool returned by get_pool().
+        """
+        with self._lock:
+            if pool in self._private:
+                self._private.discard(pool)
+                pool.shutdown(wait=False)
+                return
+            if pool is not self._pool:
+                return
+            self._users = max(0, self._users - 1)
+            if self._users == 0:
+                self._idle_timer = threading.Timer(self.idle_timeout_sec, self._shutdown_if_idle)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+    
+    @contextlib.contextmanager
+    def pool(self, max_workers: int) -> Iterator[ThreadPoolExecutor]:
+        """Borrow the shared pool for the duration of a with block.
+        
+        Args:
+            max_workers: Number of workers the caller wants.
+        
+        Yields:
+            The shared thread pool.
+        """
+        pool = self.get_pool(max_workers)
+        try:
+            yield pool
+        finally:
+            self.return_pool(pool)
+    
+    def shutdown(self):
+        """Shut the pool down now, dropping queued work."""
+        with self._lock:
+            self._cancel_idle_timer()
+            for pool in self._private:
+                _shutdown_now(pool)
+            self._private.clear()
+            if self._pool is not None:
+                _shutdown_now(self._pool)
+            self._pool = None
+            self._pool_size = 0
+            self._users = 0
+    
+    def _shutdown_if_idle(self):
+        """Shut the pool down if nobody picked it up since the timer started."""
+        with self._lock:
+            if self._users == 0 and self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+                self._pool_size = 0
+                self._idle_timer = None
+                logging.info("Worker pool shut down after idle timeout")
+    
+    def _cancel_idle_timer(self):
+        """Stop a pending idle shutdown. Caller holds the lock."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None